@@ -0,0 +1,130 @@
+import argparse
+import array
+import os
+import sys
+import tempfile
+import time
+
+# Measures the delay between Sound.play() and the sound reaching the output.
+#   offline:  renders through SDL's "disk" audio driver and finds the onset in the written stream
+#   loopback: records from a capture device (e.g. a PulseAudio monitor or a cable from line out to line in)
+ONSET_THRESHOLD = 500  # 16-bit sample amplitude that counts as "sound started"
+SETTLE_SECONDS = 0.3
+LISTEN_SECONDS = 0.5
+
+
+def find_onset(samples, threshold=ONSET_THRESHOLD):
+    for index, value in enumerate(samples):
+        if abs(value) > threshold:
+            return index
+    return None
+
+
+def measure_offline(profile_name, sound_path, trials):
+    from main import AUDIO_PROFILES, sound_bank
+
+    profile = AUDIO_PROFILES[profile_name]
+    latencies = []
+    output_path = os.environ["SDL_DISKAUDIOFILE"]
+    frame_bytes = 2 * profile["channels"]
+    sound_bank.init_mixer(profile_name)
+    sound = sound_bank.sounds[sound_path]
+    for _ in range(trials):
+        time.sleep(SETTLE_SECONDS)
+        position = os.path.getsize(output_path)
+        sound_bank.play(sound_path)
+        time.sleep(max(LISTEN_SECONDS, sound.get_length()))
+        with open(output_path, "rb") as f:
+            f.seek(position - position % frame_bytes)
+            samples = array.array("h")
+            samples.frombytes(f.read())
+        onset = find_onset(samples)
+        if onset is None:
+            print("Warning: No onset found in rendered output")
+            continue
+        latencies.append(onset / profile["channels"] / profile["frequency"])
+    return latencies
+
+
+def measure_loopback(profile_name, sound_path, trials, device_name):
+    from pygame._sdl2.audio import AudioDevice, AUDIO_S16, AUDIO_ALLOW_FORMAT_CHANGE
+    from main import AUDIO_PROFILES, sound_bank
+
+    profile = AUDIO_PROFILES[profile_name]
+    chunks = []
+
+    def on_capture(device, memory):
+        chunks.append((time.perf_counter(), bytes(memory)))
+
+    sound_bank.init_mixer(profile_name)
+    capture = AudioDevice(
+        devicename=device_name,
+        iscapture=True,
+        frequency=profile["frequency"],
+        audioformat=AUDIO_S16,
+        numchannels=1,
+        chunksize=profile["buffer"],
+        allowed_changes=AUDIO_ALLOW_FORMAT_CHANGE,
+        callback=on_capture,
+    )
+    capture.pause(0)
+
+    latencies = []
+    sound = sound_bank.sounds[sound_path]
+    for _ in range(trials):
+        time.sleep(SETTLE_SECONDS)
+        chunks.clear()
+        play_time = time.perf_counter()
+        sound_bank.play(sound_path)
+        time.sleep(max(LISTEN_SECONDS, sound.get_length()))
+        for received_at, data in list(chunks):
+            samples = array.array("h")
+            samples.frombytes(data)
+            onset = find_onset(samples)
+            if onset is not None:
+                # A chunk is delivered once full, so the onset happened (len - onset) samples earlier
+                onset_time = received_at - (len(samples) - onset) / capture.frequency
+                latencies.append(max(0.0, onset_time - play_time))
+                break
+        else:
+            print("Warning: No onset captured; is the output routed to the capture device?")
+    capture.close()
+    return latencies
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure Sound.play() to output latency for an audio profile.")
+    parser.add_argument("--profile", default="low_latency")
+    parser.add_argument("--sound", default="wing", help="Asset name from assets/audio")
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--loopback", metavar="DEVICE", help="Capture device to record from instead of offline mode")
+    parser.add_argument("--list-devices", action="store_true")
+    args = parser.parse_args()
+
+    if not args.loopback and not args.list_devices:
+        # Must be set before the mixer opens the audio device
+        os.environ["SDL_AUDIODRIVER"] = "disk"
+        os.environ["SDL_DISKAUDIOFILE"] = os.path.join(tempfile.mkdtemp(), "render.raw")
+
+    from main import AUDIO_PATH, AUDIO_PROFILES, LatencyStats
+
+    if args.list_devices:
+        import pygame.mixer
+        from pygame._sdl2.audio import get_audio_device_names
+        pygame.mixer.init()
+        print("\n".join(get_audio_device_names(True)))
+        sys.exit(0)
+
+    profile = AUDIO_PROFILES[args.profile]
+    sound_path = os.path.join(AUDIO_PATH, f"{args.sound}.ogg")
+    if args.loopback:
+        results = measure_loopback(args.profile, sound_path, args.trials, args.loopback)
+    else:
+        results = measure_offline(args.profile, sound_path, args.trials)
+
+    stats = LatencyStats()
+    for latency in results:
+        stats.add(latency)
+    buffer_ms = profile["buffer"] / profile["frequency"] * 1000
+    print(f"Profile '{args.profile}': {profile['frequency']} Hz, buffer {profile['buffer']} ({buffer_ms:.1f} ms)")
+    print(f"Sound.play() -> output: {stats.report()}")
@@ -0,0 +1,129 @@
+import argparse
+import time
+
+from PyQt5.QtGui import QImage, QPainter
+
+import main
+from headless import create_app, Autopilot, HeadlessRunner
+from main import WINDOW_WIDTH, WINDOW_HEIGHT, GameWindow, GameState, sprite_atlas
+
+# --- Draw Call Report ---
+# Renders every frame of a seeded run twice, drawing pipes, ground, digits and menu art from their separate
+# pixmaps and from the sprite atlas. Every painter call made by render_scene() is counted and the two frames
+# are compared pixel for pixel; paint time is then measured on separate runs without the counting.
+MODES = {"adventure": GameState.ADVENTURE_MODE, "pipe_control": GameState.PIPE_CONTROL_MODE}
+COUNTED_CALLS = ["drawPixmap", "drawPixmapFragments", "drawRect", "fillRect", "drawText"]
+
+
+class CountingPainter(QPainter):
+    # The game draws through Python, so overriding the wrappers sees every call render_scene() makes
+    def __init__(self, device, counts):
+        super().__init__(device)
+        self.counts = counts
+
+    def drawPixmap(self, *args):
+        self.counts["drawPixmap"] += 1
+        super().drawPixmap(*args)
+
+    def drawPixmapFragments(self, *args):
+        self.counts["drawPixmapFragments"] += 1
+        super().drawPixmapFragments(*args)
+
+    def drawRect(self, *args):
+        self.counts["drawRect"] += 1
+        super().drawRect(*args)
+
+    def fillRect(self, *args):
+        self.counts["fillRect"] += 1
+        super().fillRect(*args)
+
+    def drawText(self, *args):
+        self.counts["drawText"] += 1
+        super().drawText(*args)
+
+
+def start_run(window, args):
+    main.rng.seed(args.seed)
+    window.restart_game()
+    return HeadlessRunner(window, MODES[args.mode], Autopilot())
+
+
+def render(window, image, args, counts=None):
+    painter = CountingPainter(image, counts) if counts is not None else QPainter(image)
+    painter.scale(args.scale, args.scale)
+    window.render_scene(painter)
+    painter.end()
+
+
+def count_calls(window, args):
+    # Both paths paint every frame from the same state, so the frames must match exactly
+    width = round(WINDOW_WIDTH * args.scale)
+    height = round(WINDOW_HEIGHT * args.scale)
+    images = {use_atlas: QImage(width, height, QImage.Format_RGB32) for use_atlas in [False, True]}
+    counts = {use_atlas: dict.fromkeys(COUNTED_CALLS, 0) for use_atlas in images}
+    mismatched = 0
+    max_difference = 0
+    runner = start_run(window, args)
+    for _ in range(args.frames):
+        runner.step()
+        for use_atlas, image in images.items():
+            window.use_atlas = use_atlas
+            render(window, image, args, counts[use_atlas])
+        if images[False] != images[True]:
+            mismatched += 1
+            max_difference = max(max_difference, channel_difference(images[False], images[True]))
+    return counts, mismatched, max_difference
+
+
+def channel_difference(first, second):
+    first_bytes = first.constBits().asstring(first.sizeInBytes())
+    second_bytes = second.constBits().asstring(second.sizeInBytes())
+    return max(abs(a - b) for a, b in zip(first_bytes, second_bytes))
+
+
+def time_paint(window, args, use_atlas):
+    image = QImage(round(WINDOW_WIDTH * args.scale), round(WINDOW_HEIGHT * args.scale), QImage.Format_RGB32)
+    window.use_atlas = use_atlas
+    runner = start_run(window, args)
+    paint_time = 0.0
+    for _ in range(args.frames):
+        runner.step()
+        paint_start = time.perf_counter()
+        render(window, image, args)
+        paint_time += time.perf_counter() - paint_start
+    return paint_time / args.frames
+
+
+def report(args):
+    app = create_app()
+    window = GameWindow(display_scale=args.scale)
+    # With the atlas, hitboxes are drawn after each whole batch rather than after each pipe
+    window.debug_mode = args.debug
+    fragments_before = sprite_atlas.fragments
+    counts, mismatched, max_difference = count_calls(window, args)
+    fragments = (sprite_atlas.fragments - fragments_before) / args.frames
+    # Timed without the counting overrides; the fastest of the repeats is reported
+    paint_times = {use_atlas: min(time_paint(window, args, use_atlas) for _ in range(args.repeats))
+                   for use_atlas in [False, True]}
+
+    print(f"{args.frames} frames at {args.scale:g}x, atlas {sprite_atlas.pixmap.width()}x"
+          f"{sprite_atlas.pixmap.height()} with {len(sprite_atlas.regions)} sprites")
+    for use_atlas, paint_time in paint_times.items():
+        calls = "  ".join(f"{name} {counts[use_atlas][name] / args.frames:5.2f}" for name in COUNTED_CALLS)
+        print(f"{'atlas   ' if use_atlas else 'separate'}  {paint_time * 1000:6.3f} ms/frame  per frame: {calls}")
+    print(f"Atlas batches carry {fragments:.2f} fragments per frame")
+    print(f"{mismatched} of {args.frames} frames differ between the two paths"
+          + (f", by at most {max_difference}/255 per channel" if mismatched else ""))
+    app.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare draw calls and paint time with and without the "
+                                                 "sprite atlas.")
+    parser.add_argument("--frames", type=int, default=1500)
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per path; the fastest is reported")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--mode", choices=MODES, default="adventure")
+    parser.add_argument("--debug", action="store_true", help="Keep the debug overlay")
+    report(parser.parse_args())
@@ -0,0 +1,111 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtGui import QImage, QPainter
+
+from headless import create_app, Autopilot, HeadlessRunner
+from main import WINDOW_WIDTH, WINDOW_HEIGHT, GameWindow, GameState
+
+# --- Offscreen Frame Export ---
+# Runs the game at a fixed step as fast as the CPU allows and renders every frame with the window's
+# own render_scene() into one reused QImage. Encoding happens on a thread pool; QImage.save releases
+# the GIL, so PNG compression runs in parallel with the simulation.
+
+MODES = {"adventure": GameState.ADVENTURE_MODE, "pipe_control": GameState.PIPE_CONTROL_MODE}
+FRAME_FORMAT = QImage.Format_RGB32
+
+
+def write_png(data, width, height, path):
+    image = QImage(data, width, height, width * 4, FRAME_FORMAT)
+    if not image.save(path, "PNG"):
+        raise IOError(f"Could not write '{path}'")
+
+
+def to_rgb(data, width, height):
+    image = QImage(data, width, height, width * 4, FRAME_FORMAT).convertToFormat(QImage.Format_RGB888)
+    row_bytes = width * 3
+    bits = image.constBits().asstring(image.sizeInBytes())
+    if image.bytesPerLine() == row_bytes:
+        return bits
+    # Scanlines are padded to 4 bytes; raw RGB streams aren't
+    return b"".join(bits[y * image.bytesPerLine():y * image.bytesPerLine() + row_bytes] for y in range(height))
+
+
+def export(args):
+    app = create_app()
+    # Assets are pre-scaled to the output size, so every frame blits them 1:1
+    window = GameWindow(display_scale=args.scale)
+    window.debug_mode = args.debug
+    runner = HeadlessRunner(window, MODES[args.mode], Autopilot())
+
+    width = round(WINDOW_WIDTH * args.scale)
+    height = round(WINDOW_HEIGHT * args.scale)
+    image = QImage(width, height, FRAME_FORMAT)
+
+    raw_output = None
+    if args.raw:
+        raw_output = sys.stdout.buffer if args.raw == "-" else open(args.raw, "wb")
+    else:
+        os.makedirs(args.output, exist_ok=True)
+
+    pending = deque()
+    max_pending = args.workers * 4
+    start_time = time.perf_counter()
+    render_time = 0.0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for frame in range(args.end):
+            runner.step()
+            if frame < args.start:
+                continue
+
+            render_start = time.perf_counter()
+            painter = QPainter(image)
+            if args.scale != 1:
+                painter.scale(args.scale, args.scale)
+            window.render_scene(painter)
+            painter.end()
+            # The image is reused next frame, so the workers get their own copy of the pixels
+            data = image.constBits().asstring(image.sizeInBytes())
+            render_time += time.perf_counter() - render_start
+
+            if raw_output:
+                pending.append(pool.submit(to_rgb, data, width, height))
+            else:
+                path = os.path.join(args.output, f"frame_{frame:06d}.png")
+                pending.append(pool.submit(write_png, data, width, height, path))
+
+            # Raw frames must be written in order; PNGs just need backpressure
+            while len(pending) > max_pending or (pending and pending[0].done()):
+                result = pending.popleft().result()
+                if raw_output:
+                    raw_output.write(result)
+        while pending:
+            result = pending.popleft().result()
+            if raw_output:
+                raw_output.write(result)
+
+    if raw_output and raw_output is not sys.stdout.buffer:
+        raw_output.close()
+
+    elapsed = time.perf_counter() - start_time
+    frames = args.end - args.start
+    print(f"Exported {frames} frames at {width}x{height} in {elapsed:.2f} s: "
+          f"{frames / elapsed:.1f} fps ({frames / elapsed * GameWindow.TICK_INTERVAL / 1000:.1f}x realtime), "
+          f"render {render_time / max(1, frames) * 1000:.2f} ms/frame", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render gameplay to a PNG sequence or raw RGB stream.")
+    parser.add_argument("--mode", choices=MODES, default="adventure")
+    parser.add_argument("--start", type=int, default=0, help="First frame to write (earlier ticks are simulated)")
+    parser.add_argument("--end", type=int, default=600, help="Frame to stop before")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--output", default="export", help="Directory for the PNG sequence")
+    parser.add_argument("--raw", metavar="FILE", help="Write a raw rgb24 stream to FILE ('-' for stdout) instead")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--debug", action="store_true", help="Keep the debug overlay")
+    export(parser.parse_args())
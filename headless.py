@@ -0,0 +1,86 @@
+import os
+import sys
+
+from PyQt5.QtWidgets import QApplication
+
+from main import GameWindow, GameState
+
+
+def create_app(argv=None):
+    # No window system and no sound card needed; must run before the QApplication and the mixer exist
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # SDL otherwise takes over SIGINT/SIGTERM, and pool workers that ran a game then ignore terminate()
+    os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+    return QApplication.instance() or QApplication(argv or sys.argv[:1])
+
+
+# --- Scripted Policy ---
+# Plays through the same input queue a human uses: flaps to stay above the bottom of the next gap in
+# Adventure mode, and keeps the next gap centred on the bird in Pipe Control mode.
+class Autopilot:
+    def __init__(self, flap_margin=12, rng=None, miss_chance=0.0):
+        self.flap_margin = flap_margin
+        self.rng = rng
+        self.miss_chance = miss_chance
+
+    def next_pipe(self, window):
+        for pipe in window.pipes:
+            if pipe.x + pipe.width > window.bird.x:
+                return pipe
+        return None
+
+    def act(self, window):
+        bird = window.bird
+        pipe = self.next_pipe(window)
+        if window.game_state == GameState.ADVENTURE_MODE:
+            target_y = pipe.gap_y + pipe.gap_height - self.flap_margin if pipe else window.BIRD_START_Y + 50
+            if bird.y + bird.height > target_y and bird.velocity > 0:
+                if self.rng is None or self.rng.random() >= self.miss_chance:
+                    window.input_queue.push("flap")
+        elif window.game_state == GameState.PIPE_CONTROL_MODE:
+            window.input_queue.push_mouse_move(int(bird.y + bird.height / 2))
+
+
+# --- Fixed-Step Runner ---
+# Steps a GameWindow without an event loop. Spawns and events run on the window's tick scheduler, so
+# one update_game() per step is enough; the main timer is stopped and the modal name dialog is skipped.
+class HeadlessRunner:
+    GAME_OVER_HOLD_TICKS = 2000 // GameWindow.TICK_INTERVAL
+    MENU_HOLD_TICKS = 60
+
+    def __init__(self, window, game_mode, policy=None, auto_restart=True):
+        self.window = window
+        self.game_mode = game_mode
+        self.policy = policy
+        self.auto_restart = auto_restart
+        self.tick = 0
+        self.runs = 0
+        self.hold_ticks = 0
+        window.main_game_timer.stop()
+        # Scripted runs shouldn't replace a player's ghost
+        window.record_ghosts = False
+
+    def start(self):
+        self.window.start_game(self.game_mode)
+        self.runs += 1
+
+    def step(self):
+        window = self.window
+        self.tick += 1
+
+        if window.game_state == GameState.GAME_OVER:
+            window.game_over_timer.stop()
+            self.hold_ticks += 1
+            if self.auto_restart and self.hold_ticks >= self.GAME_OVER_HOLD_TICKS:
+                window.restart_game()
+                self.hold_ticks = 0
+        elif window.game_state == GameState.MAIN_MENU and self.auto_restart:
+            self.hold_ticks += 1
+            if self.hold_ticks >= self.MENU_HOLD_TICKS or self.runs == 0:
+                self.start()
+                self.hold_ticks = 0
+
+        if self.policy:
+            self.policy.act(window)
+        window.update_game()
@@ -1,7 +1,7 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QInputDialog, QLineEdit
 from PyQt5.QtGui import QColor, QPainter, QPixmap, QFont, QPen, QTransform, QIcon
-from PyQt5.QtCore import Qt, QTimer, QRect, QPointF
+from PyQt5.QtCore import Qt, QTimer, QRect, QRectF, QPointF, pyqtSignal
 import random
 from enum import Enum, auto
 import json
@@ -9,6 +9,16 @@ import os
 import pygame.mixer
 import time
 import math
+import struct
+import heapq
+import gc
+import tracemalloc
+import threading
+import array
+import atexit
+from collections import deque, namedtuple
+
+from telemetry import Telemetry, percentile
 
 # --- Global Game Configuration ---
 WINDOW_WIDTH = 288
@@ -26,12 +36,19 @@ DECORATION_PIPE_Y = 300
 BIRD_PIPE_CONTROL_SPEED = 1.0
 GRAVITY_BIRD_CONTROL_ACCELERATION = 0.2
 LEADERBOARD_FILE = "data/leaderboard.json"
+GHOST_FILE = "data/ghost_{mode}_{skin}.bin"
+GHOST_OPACITY = 0.35
+GHOST_CHUNK_TICKS = 256  # Ticks buffered in memory while recording or replaying a ghost
 BACKGROUND_SCROLL_SPEED = 0.5
 SPECIAL_PIPE_CHANCE = 0.2  # 20% chance to spawn a special pipe
 MOVING_PIPE_CHANCE = 0.5  # 5% chance to spawn a moving pipe
 DOUBLE_MOVING_PIPE_CHANCE = 0.5  # 50% chance to spawn a second moving pipe
 MOVING_PIPE_GAP = 150  # Wider gap for moving pipes
 BIRD_ROTATION_EASING = 0.02
+DEATH_CAUSES = ["ground", "ceiling", "pipe"]
+RANDOM_EVENTS = ["Moon Gravity", "Size Changer", "Double Score", "Cloudy Sky"]
+BIRD_SKINS = ["red", "blue", "yellow"]
+INPUT_LATENCY_SAMPLES = 512  # Number of input-to-photon samples kept for the p50/p99 report
 
 # --- Cloudy Sky Event Configuration Updates ---
 GROUND_DARKENING_OPACITY = 0.35
@@ -41,6 +58,85 @@ SCREEN_DARKENING_COLOR_R = 20
 SCREEN_DARKENING_COLOR_G = 20
 SCREEN_DARKENING_COLOR_B = 60
 
+# --- Display Scaling ---
+# "1", "2", "1.5", ...: fixed factor; "auto": largest integer factor that fits the screen; "fit": largest
+# fractional factor. The simulation stays at WINDOW_WIDTH x WINDOW_HEIGHT; only the window and assets grow.
+DISPLAY_SCALE = os.environ.get("FLAPPY_DISPLAY_SCALE", "1")
+DISPLAY_SCALE_MARGIN = 0.95  # Fraction of the available screen area "auto"/"fit" may use (title bar, taskbar)
+
+# --- Game Clock ---
+# Simulated seconds advance one tick at a time, so pausing or slowing the simulation also stops events,
+# the day/night cycle and cloud animations. FLAPPY_TIME_SCALE=8 fast-forwards, 0.5 runs at half speed.
+TIME_SCALE = float(os.environ.get("FLAPPY_TIME_SCALE", "1.0"))
+TIME_SCALE_STEPS = [0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0]
+MAX_TICKS_PER_FRAME = 32  # Upper bound on catch-up ticks per timer fire when fast-forwarding
+
+# --- Frame Budget ---
+# Keeps cyclic GC out of active play: startup objects are frozen, generational collection is paused
+# while playing and run at safe points (game over, menus, pause) instead.
+FRAME_BUDGET_MODE = os.environ.get("FLAPPY_FRAME_BUDGET", "1") != "0"
+FRAME_BUDGET_GC_LIMIT = 50000  # Young-generation count that forces a gen-0 collection even mid-play
+TRACE_ALLOCATIONS = os.environ.get("FLAPPY_TRACE_ALLOC", "0") == "1"
+ALLOC_REPORT_INTERVAL = 300  # ticks between tracemalloc allocation reports
+ALLOC_REPORT_TOP = 10
+ALLOC_SAMPLE_INTERVAL = 10  # Every Nth frame is profiled call by call for per-function allocations
+ALLOC_PROFILE_DEPTH = 256  # Deepest call stack the per-call counters have room for
+
+# --- Rewind ---
+# In debug mode the last REWIND_SECONDS of play are kept as packed snapshots; Left/Right scrub, Enter resumes
+REWIND_SECONDS = 10
+REWIND_MAX_PIPES = 16  # Pipe slots per snapshot; more than a few on screen only happens under stress
+REWIND_FAST_STEP = 10  # Frames per step with Shift held
+
+# --- Quality Governor ---
+# "auto" degrades effects tier by tier while frames run close to the budget and restores them once there is
+# headroom again; a number pins a tier. Each tier keeps the savings of the ones before it.
+QUALITY_MODE = os.environ.get("FLAPPY_QUALITY", "auto")
+QUALITY_TIERS = ["full", "no antialiasing", "fewer cloud layers", "fewer clouds", "stepped crossfade", "cached HUD"]
+QUALITY_WINDOW_FRAMES = 60  # Frames per evaluation window
+QUALITY_DEGRADE_FRACTION = 0.85  # p90 busy time per frame, as a fraction of the frame budget, that steps down
+QUALITY_UPGRADE_FRACTION = 0.5  # ... and that counts as headroom for stepping back up
+QUALITY_UPGRADE_WINDOWS = 5  # Consecutive windows with headroom before stepping up
+QUALITY_MAX_UPGRADE_WINDOWS = 80
+QUALITY_CLOUD_LAYERS = [1, 3]  # cloud_configs kept from "fewer cloud layers": one background, one foreground
+QUALITY_CLOUD_SPAWN_DIVISOR = 2  # "fewer clouds" keeps one spawn in this many
+QUALITY_FADE_STEPS = 4  # Day/night blend levels with "stepped crossfade"
+
+# --- Simulation Thread ---
+# FLAPPY_SIM_THREAD=1 steps the world on a worker thread at a fixed rate; the GUI thread only paints the newest
+# published frame and forwards input, so a slow paint or the modal name dialog no longer stalls physics.
+SIMULATION_THREAD = os.environ.get("FLAPPY_SIM_THREAD", "0") == "1"
+SIMULATION_MAX_LAG_TICKS = 8  # Ticks the worker may fall behind before it resyncs instead of catching up
+PACING_SAMPLES = 1024  # Frame and tick intervals kept for the pacing report
+
+# --- Sprite Atlas ---
+# Pipes, ground, score digits and the menu/game over art are packed into one texture and drawn in one
+# drawPixmapFragments batch per layer. FLAPPY_ATLAS=0 draws them from their separate pixmaps instead.
+SPRITE_ATLAS = os.environ.get("FLAPPY_ATLAS", "1") != "0"
+ATLAS_WIDTH = 640  # Logical pixels; fits the message art and all four pipes on the first shelf
+ATLAS_PADDING = 2  # Device pixels between sprites, so filtered downscales never sample a neighbour
+
+# --- Telemetry ---
+# Directory that receives telemetry.prom (Prometheus text format) and telemetry.jsonl; empty disables flushing
+TELEMETRY_DIR = os.environ.get("FLAPPY_TELEMETRY", "")
+TELEMETRY_FLUSH_SECONDS = 60
+TIME_BUCKETS = [0.001, 0.002, 0.004, 0.008, 0.012, 0.016, 0.020, 0.033, 0.050, 0.100, 0.250]
+SOUND_PLAY_BUCKETS = [0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01]
+
+# --- Spectator Broadcast ---
+# Comma-separated host:port list that receives a delta-encoded snapshot after every tick (see spectator.py)
+SPECTATOR_TARGETS = os.environ.get("FLAPPY_SPECTATOR", "")
+
+# --- Audio Mixer Profiles ---
+# "low_latency" keeps the wing sound in sync with the flap; "fallback" is for machines that underrun.
+# The fallback is only used automatically when the low-latency profile fails to open: pygame does not
+# report underruns, so crackling machines need FLAPPY_AUDIO_PROFILE=fallback.
+AUDIO_PROFILES = {
+    "low_latency": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 256},
+    "fallback": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 1024},
+}
+AUDIO_PROFILE = os.environ.get("FLAPPY_AUDIO_PROFILE", "low_latency")
+
 # --- File Paths ---
 ASSETS_PATH = "assets"
 AUDIO_PATH = os.path.join(ASSETS_PATH, "audio")
@@ -51,6 +147,7 @@ AUDIO_HIT = os.path.join(AUDIO_PATH, "hit.ogg")
 AUDIO_POINT = os.path.join(AUDIO_PATH, "point.ogg")
 AUDIO_SWOOSH = os.path.join(AUDIO_PATH, "swoosh.ogg")
 AUDIO_WING = os.path.join(AUDIO_PATH, "wing.ogg")
+AUDIO_FILES = [AUDIO_DIE, AUDIO_HIT, AUDIO_POINT, AUDIO_SWOOSH, AUDIO_WING]
 # Sprites
 BACKGROUND_DAY = os.path.join(SPRITES_PATH, "background-day.png")
 BACKGROUND_NIGHT = os.path.join(SPRITES_PATH, "background-night.png")
@@ -61,6 +158,19 @@ PIPE_GREEN = os.path.join(SPRITES_PATH, "pipe-green.png")
 PIPE_RED = os.path.join(SPRITES_PATH, "pipe-red.png")
 CLOUDS_BG_PATH = os.path.join(SPRITES_PATH, "cloud_bg.png")
 CLOUDS_FG_PATH = os.path.join(SPRITES_PATH, "cloud_fg.png")
+# Atlas sprites by name: (path, AssetCache.pixmap options). The options match the ones the game loads
+# the separate pixmaps with, so both paths share cache entries and draw identical pixels.
+ATLAS_SPRITES = {
+    "pipe_green": (PIPE_GREEN, {"width": PIPE_WIDTH}),
+    "pipe_green_flipped": (PIPE_GREEN, {"width": PIPE_WIDTH, "rotation": 180}),
+    "pipe_red": (PIPE_RED, {"width": PIPE_WIDTH}),
+    "pipe_red_flipped": (PIPE_RED, {"width": PIPE_WIDTH, "rotation": 180}),
+    "ground": (GROUND_PATH, {"width": WINDOW_WIDTH + 10, "height": GROUND_HEIGHT,
+                             "transform_mode": Qt.SmoothTransformation}),
+    "message": (MESSAGE_PATH, {"width": int(WINDOW_WIDTH * 0.8)}),
+    "game_over": (GAME_OVER_PATH, {"width": int(WINDOW_WIDTH * 0.8)}),
+}
+ATLAS_SPRITES.update({f"digit_{i}": (os.path.join(SPRITES_PATH, f"{i}.png"), {}) for i in range(10)})
 
 
 # --- Game States ---
@@ -70,10 +180,338 @@ class GameState(Enum):
     PAUSED = auto()
     GAME_OVER = auto()
     PIPE_CONTROL_MODE = auto()
+# --- Telemetry Metrics ---
+telemetry = Telemetry()
+METRIC_FRAME_TIME = telemetry.histogram("flappy_frame_seconds", "Time between frame timer fires.", TIME_BUCKETS)
+METRIC_TICK_TIME = telemetry.histogram("flappy_tick_seconds", "Time spent in one simulation tick.", TIME_BUCKETS)
+METRIC_PAINT_TIME = telemetry.histogram("flappy_paint_seconds", "Time spent painting one frame.", TIME_BUCKETS)
+METRIC_DROPPED_FRAMES = telemetry.counter("flappy_dropped_frames_total",
+                                          "Frame timer intervals missed because a frame ran late.")
+METRIC_SOUND_PLAY = telemetry.histogram("flappy_sound_play_seconds", "Time for a sound play() call to return.",
+                                        SOUND_PLAY_BUCKETS)
+METRIC_TEXTURE_CACHE = telemetry.counter("flappy_texture_cache_total", "Asset cache lookups.",
+                                         "result", ["hit", "miss"])
+METRIC_PIPES_SPAWNED = telemetry.counter("flappy_pipes_spawned_total", "Pipes spawned.")
+METRIC_PIPES_PASSED = telemetry.counter("flappy_pipes_passed_total", "Pipes passed by the bird.")
+METRIC_EVENTS = telemetry.counter("flappy_events_total", "Random events triggered.", "event", RANDOM_EVENTS)
+METRIC_DEATHS = telemetry.counter("flappy_deaths_total", "Games ended, by cause of death.", "cause", DEATH_CAUSES)
+
+
+# --- Sound Bank ---
+# Every sound is decoded once at startup; pygame converts it to the mixer's native format on load,
+# so playback is just a channel lookup instead of an OGG decode per flap.
+class SoundBank:
+    def __init__(self):
+        self.sounds = {}
+        self.profile_name = None
+        self.wing_channel = None
+
+    def init_mixer(self, profile_name=AUDIO_PROFILE):
+        if pygame.mixer.get_init():
+            return
+        for name in dict.fromkeys([profile_name, "fallback"]):
+            profile = AUDIO_PROFILES.get(name)
+            if profile is None:
+                print(f"Warning: Unknown audio profile '{name}'")
+                continue
+            try:
+                pygame.mixer.init(**profile)
+                self.profile_name = name
+                break
+            except pygame.error as e:
+                print(f"Error initializing audio profile '{name}': {e}")
+
+        if pygame.mixer.get_init():
+            self.preload()
+
+    def preload(self):
+        for path in AUDIO_FILES:
+            try:
+                self.sounds[path] = pygame.mixer.Sound(path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error: Sound '{path}' could not be loaded: {e}")
+        # The wing sound gets its own channel so rapid flaps never wait for a free one
+        pygame.mixer.set_reserved(1)
+        self.wing_channel = pygame.mixer.Channel(0)
+
+    def share_wing_channel(self, channels):
+        # Several games in one process would cut each other's flaps off on the one reserved channel, so every
+        # sound plays on any free channel instead
+        if not pygame.mixer.get_init():
+            return
+        self.wing_channel = None
+        pygame.mixer.set_reserved(0)
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+
+    def play(self, path):
+        sound = self.sounds.get(path)
+        if sound is None:
+            return
+        start = time.perf_counter()
+        if path == AUDIO_WING and self.wing_channel is not None:
+            self.wing_channel.play(sound)
+        else:
+            sound.play()
+        telemetry.observe(METRIC_SOUND_PLAY, time.perf_counter() - start)
+
+
+sound_bank = SoundBank()
+
+
+# --- Asset Cache ---
+# Every texture is scaled from its source image once per asset scale (display scale x devicePixelRatio)
+# and tagged with that ratio, so draw code keeps using logical coordinates and each blit is 1:1 on screen.
+class AssetCache:
+    def __init__(self, scale=1.0):
+        self.scale = scale
+        self.sources = {}
+        self.pixmaps = {}
+
+    def set_scale(self, scale):
+        if scale != self.scale:
+            self.scale = scale
+            self.pixmaps.clear()
+
+    def source(self, path):
+        pixmap = self.sources.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                print(f"Error: Texture '{path}' could not be loaded!")
+            self.sources[path] = pixmap
+        return pixmap
+
+    def pixmap(self, path, width=None, height=None, aspect_mode=Qt.IgnoreAspectRatio,
+               transform_mode=Qt.FastTransformation, rotation=0):
+        key = (path, width, height, aspect_mode, transform_mode, rotation)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            telemetry.count(METRIC_TEXTURE_CACHE + 1)
+            pixmap = self.scale_source(path, width, height, aspect_mode, transform_mode, rotation)
+            self.pixmaps[key] = pixmap
+        else:
+            telemetry.count(METRIC_TEXTURE_CACHE)
+        return pixmap
+
+    def scale_source(self, path, width, height, aspect_mode, transform_mode, rotation):
+        source = self.source(path)
+        if source.isNull():
+            return QPixmap()
+        # Missing dimensions follow the source's aspect ratio, like QPixmap.scaledToWidth/scaledToHeight
+        if width is None and height is None:
+            width, height = source.width(), source.height()
+        elif height is None:
+            height = source.height() * width / source.width()
+        elif width is None:
+            width = source.width() * height / source.height()
+        pixmap = source.scaled(max(1, round(width * self.scale)), max(1, round(height * self.scale)),
+                               aspect_mode, transform_mode)
+        if rotation:
+            pixmap = pixmap.transformed(QTransform().rotate(rotation))
+        pixmap.setDevicePixelRatio(self.scale)
+        return pixmap
+
+
+def pixmap_size(pixmap):
+    # Size in logical pixels; QPixmap.width()/height() report device pixels
+    ratio = pixmap.devicePixelRatio()
+    return pixmap.width() / ratio, pixmap.height() / ratio
+
+
+def resolve_display_scale(setting):
+    if setting in ("auto", "fit"):
+        screen = QApplication.primaryScreen()
+        if screen is None:
+            return 1.0
+        available = screen.availableGeometry()
+        scale = DISPLAY_SCALE_MARGIN * min(available.width() / WINDOW_WIDTH, available.height() / WINDOW_HEIGHT)
+        return max(1.0, math.floor(scale) if setting == "auto" else scale)
+    try:
+        return max(0.25, float(setting))
+    except ValueError:
+        print(f"Warning: Invalid display scale '{setting}', using 1")
+        return 1.0
+
+
+asset_cache = AssetCache()
+
+
+# --- Sprite Atlas ---
+# Shelf-packs the ATLAS_SPRITES pixmaps from the asset cache into one texture, rebuilt whenever the cache's
+# scale changes. A fragment is placed by its logical top-left corner and scaled back from device pixels,
+# so it lands exactly where drawPixmap() would have put the separate pixmap.
+class SpriteAtlas:
+    def __init__(self, cache):
+        self.cache = cache
+        self.scale = None
+        self.pixmap = None
+        self.regions = {}  # name -> (source rect in device pixels, logical width, logical height)
+        self.batches = 0
+        self.fragments = 0
+
+    def ensure(self):
+        if self.scale != self.cache.scale:
+            self.build()
+
+    def build(self):
+        self.scale = self.cache.scale
+        sprites = [(name, self.cache.pixmap(path, **options)) for name, (path, options) in ATLAS_SPRITES.items()]
+        sprites.sort(key=lambda sprite: -sprite[1].height())
+        width = max([math.ceil(ATLAS_WIDTH * self.scale)] + [pixmap.width() for _, pixmap in sprites])
+        placements = []
+        x = y = shelf_height = 0
+        for name, pixmap in sprites:
+            if x + pixmap.width() > width:
+                x = 0
+                y += shelf_height + ATLAS_PADDING
+                shelf_height = 0
+            placements.append((name, pixmap, x, y))
+            x += pixmap.width() + ATLAS_PADDING
+            shelf_height = max(shelf_height, pixmap.height())
+
+        self.pixmap = QPixmap(width, max(1, y + shelf_height))
+        self.pixmap.fill(Qt.transparent)
+        painter = QPainter(self.pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        self.regions = {}
+        for name, pixmap, x, y in placements:
+            # Explicit device-pixel target, so the source's devicePixelRatio can't shrink it
+            painter.drawPixmap(QRect(x, y, pixmap.width(), pixmap.height()), pixmap)
+            self.regions[name] = (QRectF(x, y, pixmap.width(), pixmap.height()),
+                                  pixmap.width() / self.scale, pixmap.height() / self.scale)
+        painter.end()
+
+    def size(self, name):
+        _, width, height = self.regions[name]
+        return width, height
+
+    def fragment(self, name, x, y):
+        source, width, height = self.regions[name]
+        return QPainter.PixmapFragment.create(QPointF(x + width / 2, y + height / 2), source,
+                                              1 / self.scale, 1 / self.scale)
+
+    def draw(self, painter, fragments):
+        if fragments:
+            painter.drawPixmapFragments(fragments, self.pixmap)
+            self.batches += 1
+            self.fragments += len(fragments)
+
+
+sprite_atlas = SpriteAtlas(asset_cache)
+
+
+# --- Game Clock ---
+class GameClock:
+    def __init__(self, time_scale=TIME_SCALE):
+        self.time_scale = time_scale
+        self.ticks = 0
+        self.now = 0.0
+        self.paused = False
+        self.pending_ticks = 0.0
+
+    def advance(self, seconds):
+        if self.paused:
+            return
+        self.ticks += 1
+        self.now += seconds
+
+    def frame_ticks(self):
+        # Whole simulation ticks owed for one timer fire at the current time scale
+        self.pending_ticks = min(self.pending_ticks + self.time_scale, MAX_TICKS_PER_FRAME)
+        ticks = int(self.pending_ticks)
+        self.pending_ticks -= ticks
+        return ticks
+
+
+# Default clock and random streams; a GameWindow reads its own clock, rng and cloud_rng attributes, so a host
+# running several games in one process gives each window its own instead
+game_clock = GameClock()
+
+
+# --- Random Number Generator ---
+# Every simulation draw goes through the window's rng. Counting draws lets the rewind buffer copy the 2.5 KB Mersenne
+# Twister state only on ticks that actually consumed randomness. getrandbits() is overridden alongside
+# random() so randint()/choice() keep the same sequences as the random module for a given seed.
+class GameRandom(random.Random):
+    draws = 0
+
+    def random(self):
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+rng = GameRandom()
+# Clouds are cosmetic; giving them their own stream lets quality tiers skip them without shifting gameplay draws
+cloud_rng = random.Random()
+
+
+# --- Tick Scheduler ---
+# Min-heap of named callbacks keyed by simulation tick. It advances with the game clock, so everything on
+# it pauses, fast-forwards and resets together. Scheduling a name that is already pending replaces it;
+# replaced and cancelled entries are dropped when they reach the top of the heap.
+class TickScheduler:
+    def __init__(self, tick_seconds):
+        self.tick_seconds = tick_seconds
+        self.tick = 0
+        self.heap = []
+        self.entries = {}
+        self.sequence = 0
+
+    def ticks_for(self, seconds):
+        return max(1, round(seconds / self.tick_seconds))
+
+    def schedule(self, name, seconds, callback, repeat=False):
+        delay = self.ticks_for(seconds)
+        # [due tick, sequence, name, callback, repeat interval]; the sequence keeps equal ticks in FIFO order
+        entry = [self.tick + delay, self.sequence, name, callback, delay if repeat else 0]
+        self.sequence += 1
+        self.entries[name] = entry
+        heapq.heappush(self.heap, entry)
+
+    def cancel(self, *names):
+        for name in names:
+            self.entries.pop(name, None)
+
+    def is_scheduled(self, name):
+        return name in self.entries
+
+    def restore(self, tick, entries):
+        # entries: (name, due tick, callback, repeat interval), e.g. from a rewind snapshot
+        self.tick = tick
+        self.heap = []
+        self.entries = {}
+        for name, due, callback, interval in entries:
+            entry = [due, self.sequence, name, callback, interval]
+            self.sequence += 1
+            self.entries[name] = entry
+            heapq.heappush(self.heap, entry)
+
+    def advance(self):
+        self.tick += 1
+        while self.heap and self.heap[0][0] <= self.tick:
+            entry = heapq.heappop(self.heap)
+            name, callback, interval = entry[2], entry[3], entry[4]
+            if self.entries.get(name) is not entry:
+                continue
+            if interval:
+                entry[0] += interval
+                entry[1] = self.sequence
+                self.sequence += 1
+                heapq.heappush(self.heap, entry)
+            else:
+                del self.entries[name]
+            callback()
+
+
 # --- Bird Class (Modified for Animation and Rotation) ---
 class Bird:
-    def __init__(self, x, y, color="red"):
+    def __init__(self, x, y, color="red", rng=rng):
         self.x = x
+        self.rng = rng
         self.y = y
         self.width, self.height = BIRD_ASSET_SIZE
         self.velocity = 0
@@ -84,7 +522,7 @@ class Bird:
         self.frame = 0
         self.frame_timer = 0
         self.color = color
-        self.sprite_frames = self.load_sprites()
+        self.sprite_frames = self.load_sprites(BIRD_ASSET_SIZE)
         self.max_rotation_up = -25  # Max upward tilt
         self.max_rotation_down = 90  # Max downward tilt
         self.pipe_control_velocity = 0
@@ -92,26 +530,30 @@ class Bird:
         self.pipe_control_acceleration = 0.2  # Easing factor for smooth acceleration/deceleration
         self.direction_change_timer = 0
 
-        self.direction_change_interval = random.randint(250, 350)
+        self.direction_change_interval = self.rng.randint(250, 350)
         self.moon_rotation_timer = 0
         self.moon_rotation_interval = 30
 
-    def load_sprites(self):
+    def load_sprites(self, size):
         sprites = []
         for flap in ["down", "mid", "up"]:
             path = os.path.join(SPRITES_PATH, f"{self.color}bird-{flap}flap.png")
-            sprite = QPixmap(path).scaled(*BIRD_ASSET_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            sprite = asset_cache.pixmap(path, *size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             if sprite.isNull():
-                print(f"Error: Bird texture '{path}' could not be loaded!")
                 return [QPixmap(), QPixmap(), QPixmap()]
             sprites.append(sprite)
         return sprites
 
+    def set_size(self, width, height):
+        # Resized birds flap through their frames up-first, as the Size Changer event always has
+        self.width, self.height = width, height
+        self.sprite_frames = self.load_sprites((width, height))[::-1]
+
     def flap(self):
         # Flap logic remains the same
         self.velocity = self.lift
         self.rotation = self.max_rotation_up
-        pygame.mixer.Sound(AUDIO_WING).play()
+        sound_bank.play(AUDIO_WING)
 
     def update(self, game_state):
         if game_state == GameState.ADVENTURE_MODE:
@@ -122,9 +564,9 @@ class Bird:
             if self.gravity == MOON_GRAVITY:
                 self.moon_rotation_timer += 1
                 if self.moon_rotation_timer >= self.moon_rotation_interval:
-                    self.target_rotation = random.uniform(-45, 45)  # Random rotation between -45 and 45 degrees
+                    self.target_rotation = self.rng.uniform(-45, 45)  # Random rotation between -45 and 45 degrees
                     self.moon_rotation_timer = 0
-                    self.moon_rotation_interval = random.randint(30, 90)
+                    self.moon_rotation_interval = self.rng.randint(30, 90)
 
                 # Smoothly transition to the target rotation (easing)
                 self.rotation += (self.target_rotation - self.rotation) * BIRD_ROTATION_EASING
@@ -137,9 +579,9 @@ class Bird:
         elif game_state == GameState.PIPE_CONTROL_MODE:
             self.direction_change_timer += 1
             if self.direction_change_timer >= self.direction_change_interval:
-                self.target_pipe_control_velocity = random.choice([BIRD_PIPE_CONTROL_SPEED, -BIRD_PIPE_CONTROL_SPEED])
+                self.target_pipe_control_velocity = self.rng.choice([BIRD_PIPE_CONTROL_SPEED, -BIRD_PIPE_CONTROL_SPEED])
                 self.direction_change_timer = 0
-                self.direction_change_interval = random.randint(250, 350)
+                self.direction_change_interval = self.rng.randint(250, 350)
 
             self.pipe_control_velocity += (
                         self.target_pipe_control_velocity - self.pipe_control_velocity) * self.pipe_control_acceleration
@@ -174,6 +616,9 @@ class Bird:
             self.height - 2 * hitbox_margin_y
         )
 
+    def snapshot(self):
+        return BirdFrame(self.x, self.y, self.width, self.height, self.rotation, self.frame, self.sprite_frames)
+
     def draw(self, painter, debug_mode=False):
         current_sprite = self.sprite_frames[self.frame]
         painter.save()
@@ -199,12 +644,9 @@ class Pipe:
         self.is_moving = False
 
         pipe_texture_path = PIPE_RED if is_special else PIPE_GREEN
-        self.pipe_top_texture = QPixmap(pipe_texture_path).scaledToWidth(self.width)
-        self.pipe_bottom_texture = QPixmap(pipe_texture_path).scaledToWidth(self.width).transformed(
-            QTransform().rotate(180)
-        )
-        if self.pipe_top_texture.isNull() or self.pipe_bottom_texture.isNull():
-            print("Error: Pipe textures could not be loaded!")
+        self.pipe_top_texture = asset_cache.pixmap(pipe_texture_path, self.width)
+        self.pipe_bottom_texture = asset_cache.pixmap(pipe_texture_path, self.width, rotation=180)
+        self.texture_height = pixmap_size(self.pipe_top_texture)[1]
 
     def update(self):
         self.x -= PIPE_SPEED
@@ -215,23 +657,35 @@ class Pipe:
     def get_bottom_hitbox(self, window_height):
         return QRect(int(self.x), int(self.gap_y + self.gap_height), self.width, window_height)
 
+    def snapshot(self):
+        return PipeFrame(self.x, self.gap_y, self.gap_height, self.width, self.is_special, self.pipe_top_texture,
+                         self.pipe_bottom_texture, self.texture_height)
+
     def draw(self, painter, window_height, debug_mode=False):
-        painter.drawPixmap(int(self.x), int(self.gap_y - self.pipe_top_texture.height()), self.pipe_top_texture)
+        painter.drawPixmap(int(self.x), int(self.gap_y - self.texture_height), self.pipe_top_texture)
         painter.drawPixmap(int(self.x), int(self.gap_y + self.gap_height), self.pipe_bottom_texture)
 
         if debug_mode:
-            painter.setPen(QColor(0, 255, 255))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawRect(self.get_top_hitbox())
-            painter.drawRect(self.get_bottom_hitbox(window_height))
+            self.draw_hitboxes(painter, window_height)
+
+    def add_fragments(self, fragments, atlas):
+        name = "pipe_red" if self.is_special else "pipe_green"
+        fragments.append(atlas.fragment(name, int(self.x), int(self.gap_y - self.texture_height)))
+        fragments.append(atlas.fragment(name + "_flipped", int(self.x), int(self.gap_y + self.gap_height)))
+
+    def draw_hitboxes(self, painter, window_height):
+        painter.setPen(QColor(0, 255, 255))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(self.get_top_hitbox())
+        painter.drawRect(self.get_bottom_hitbox(window_height))
 class MovingPipe(Pipe):
-    def __init__(self, x, gap_y, gap_height):
+    def __init__(self, x, gap_y, gap_height, rng=rng):
         super().__init__(x, gap_y, gap_height)
         self.is_moving = True
         self.y_offset = gap_y
         self.move_amplitude = 80
         self.move_frequency = 0.006
-        self.time_offset = random.uniform(0, 2 * math.pi)
+        self.time_offset = rng.uniform(0, 2 * math.pi)
 
     def update(self):
         super().update()
@@ -241,10 +695,8 @@ class MovingPipe(Pipe):
 class Ground:
     def __init__(self):
         self.height = GROUND_HEIGHT
-        self.texture = QPixmap(GROUND_PATH).scaled(WINDOW_WIDTH + 10, self.height, Qt.IgnoreAspectRatio,
-                                                   Qt.SmoothTransformation)
-        if self.texture.isNull():
-            print("Error: Ground texture could not be loaded!")
+        self.texture = asset_cache.pixmap(GROUND_PATH, WINDOW_WIDTH + 10, self.height,
+                                          transform_mode=Qt.SmoothTransformation)
 
         self.x1 = 0
         self.x2 = WINDOW_WIDTH
@@ -260,42 +712,52 @@ class Ground:
     def get_hitbox(self):
         return QRect(0, WINDOW_HEIGHT - self.height, WINDOW_WIDTH, self.height)
 
+    def snapshot(self):
+        return GroundFrame(self.x1, self.x2, self.height, self.texture)
+
     def draw(self, painter, debug_mode=False):
         painter.drawPixmap(int(self.x1), WINDOW_HEIGHT - self.height, self.texture)
         painter.drawPixmap(int(self.x2), WINDOW_HEIGHT - self.height, self.texture)
 
         if debug_mode:
-            painter.setPen(QColor(0, 0, 255))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawRect(self.get_hitbox())
+            self.draw_hitbox(painter)
+
+    def add_fragments(self, fragments, atlas):
+        fragments.append(atlas.fragment("ground", int(self.x1), WINDOW_HEIGHT - self.height))
+        fragments.append(atlas.fragment("ground", int(self.x2), WINDOW_HEIGHT - self.height))
+
+    def draw_hitbox(self, painter):
+        painter.setPen(QColor(0, 0, 255))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(self.get_hitbox())
 # --- Cloud Class for the "Cloudy Sky" event ---
 class Cloud:
-    def __init__(self, x, y, speed, opacity, size_factor, sprite_path="clouds.png", animation_type=None):
+    def __init__(self, x, y, speed, opacity, size_factor, sprite_path="clouds.png", animation_type=None,
+                 clock=game_clock, rng=cloud_rng):
         self.x = x
+        self.clock = clock
+        self.rng = rng
         self.y = y
         self.speed = speed
         self.initial_opacity = opacity
         self.opacity = 0.0 if animation_type == "alpha_ease" else opacity
         self.size_factor = size_factor
+        self.sprite_path = sprite_path
         self.width = 0
         self.height = 0
 
-        cloud_sprite_path = sprite_path
-
-        base_sprite = QPixmap(cloud_sprite_path)
-        if base_sprite.isNull():
-            print(f"Error: Cloud texture '{cloud_sprite_path}' could not be loaded!")
-            self.sprite = QPixmap()
-        else:
-            self.sprite = base_sprite.scaled(int(base_sprite.width() * size_factor),
-                                             int(base_sprite.height() * size_factor))
-            self.width = self.sprite.width()
-            self.height = self.sprite.height()
+        # Clouds spawn every few hundred ms; the asset cache scales each sprite/size pair only once
+        base_sprite = asset_cache.source(sprite_path)
+        self.sprite = QPixmap()
+        if not base_sprite.isNull():
+            self.width = int(base_sprite.width() * size_factor)
+            self.height = int(base_sprite.height() * size_factor)
+            self.sprite = asset_cache.pixmap(sprite_path, self.width, self.height)
 
         # New animation attributes
         self.animation_type = animation_type
-        self.animation_start_time = time.time()
-        self.animation_duration = random.uniform(1.5, 3.0)  # Random duration for each cloud
+        self.animation_start_time = self.clock.now
+        self.animation_duration = self.rng.uniform(1.5, 3.0)  # Random duration for each cloud
         self.is_animating = True
 
         if self.animation_type == "y_ease":
@@ -308,7 +770,7 @@ class Cloud:
 
     def update(self):
         if self.is_animating:
-            elapsed = time.time() - self.animation_start_time
+            elapsed = self.clock.now - self.animation_start_time
             progress = min(1.0, elapsed / self.animation_duration)
 
             # Simple easing function (quadratic ease-out)
@@ -331,8 +793,591 @@ class Cloud:
         painter.drawPixmap(int(self.x), int(self.y), self.sprite)
         painter.restore()
 
+    def snapshot(self):
+        return CloudFrame(self.x, self.y, self.opacity, self.sprite)
+
+
+# --- Frame Snapshots ---
+# Immutable copies of what a frame draws, captured after a tick. Their fields carry the attribute names the
+# entity draw methods read, so those methods render a snapshot unchanged. Pixmaps are shared, not copied;
+# the simulation replaces them but never modifies them.
+class BirdFrame(namedtuple("BirdFrame", "x y width height rotation frame sprite_frames")):
+    __slots__ = ()
+    get_hitbox = Bird.get_hitbox
+    draw = Bird.draw
+
+
+class PipeFrame(namedtuple("PipeFrame", "x gap_y gap_height width is_special pipe_top_texture "
+                                        "pipe_bottom_texture texture_height")):
+    __slots__ = ()
+    get_top_hitbox = Pipe.get_top_hitbox
+    get_bottom_hitbox = Pipe.get_bottom_hitbox
+    draw = Pipe.draw
+    add_fragments = Pipe.add_fragments
+    draw_hitboxes = Pipe.draw_hitboxes
+
+
+class GroundFrame(namedtuple("GroundFrame", "x1 x2 height texture")):
+    __slots__ = ()
+    get_hitbox = Ground.get_hitbox
+    draw = Ground.draw
+    add_fragments = Ground.add_fragments
+    draw_hitbox = Ground.draw_hitbox
+
+
+class CloudFrame(namedtuple("CloudFrame", "x y opacity sprite")):
+    __slots__ = ()
+    draw = Cloud.draw
+
+
+FrameSnapshot = namedtuple("FrameSnapshot", [
+    "tick", "game_state", "score", "current_event", "is_cloudy_sky_event", "event_progress",
+    "background_is_day", "background_fade", "background_scroll_x", "ground", "bird", "ghost", "pipes",
+    "background_clouds", "foreground_clouds", "rewind",  # (frames back, frames) while scrubbing, else None
+])
+
+# --- Input Queue ---
+# Qt handlers only record timestamped input here; the simulation drains it at the start of the next tick.
+class InputQueue:
+    def __init__(self):
+        self.events = deque()
+        self.mouse_y = None
+        self.mouse_timestamp = 0.0
+        self.coalesced_moves = 0
+
+    def push(self, action):
+        self.events.append((time.perf_counter(), action, None))
+
+    def push_mouse_move(self, y):
+        # Only the latest sample per tick matters, but keep the timestamp of the first one for latency
+        if self.mouse_y is None:
+            self.mouse_timestamp = time.perf_counter()
+        else:
+            self.coalesced_moves += 1
+        self.mouse_y = y
+
+    def drain(self):
+        # popleft() rather than copy-and-clear: with a simulation thread, pushes can arrive mid-drain
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        if self.mouse_y is not None:
+            events.append((self.mouse_timestamp, "pipe_move", self.mouse_y))
+            self.mouse_y = None
+        return events
+
+    def clear(self):
+        self.events.clear()
+        self.mouse_y = None
+
+# --- Ghost Recording ---
+# A ghost file is a small header followed by one fixed-size record per tick. Recording and replay
+# both go through a single chunk-sized buffer, so memory doesn't grow with the length of the run.
+GHOST_MAGIC = b"FBG2"
+GHOST_HEADER = struct.Struct("<4sII")  # magic, score, ticks
+GHOST_RECORD = struct.Struct("<hhBBB")  # y * 4, rotation * 10, flap frame, bird width, bird height
+
+
+def ghost_path(game_mode, skin):
+    return GHOST_FILE.format(mode=game_mode.name.lower(), skin=skin)
+
+
+class GhostRecorder:
+    def __init__(self, path):
+        self.path = path
+        self.temp_path = path + ".tmp"
+        self.buffer = bytearray(GHOST_CHUNK_TICKS * GHOST_RECORD.size)
+        self.buffered = 0
+        self.ticks = 0
+        self.file = open(self.temp_path, "wb")
+        self.file.write(GHOST_HEADER.pack(GHOST_MAGIC, 0, 0))
+
+    def record(self, bird):
+        GHOST_RECORD.pack_into(self.buffer, self.buffered * GHOST_RECORD.size,
+                               max(-32768, min(32767, int(bird.y * 4))),
+                               max(-32768, min(32767, int(bird.rotation * 10))),
+                               bird.frame, min(255, bird.width), min(255, bird.height))
+        self.buffered += 1
+        self.ticks += 1
+        if self.buffered == GHOST_CHUNK_TICKS:
+            self.flush()
+
+    def flush(self):
+        self.file.write(memoryview(self.buffer)[:self.buffered * GHOST_RECORD.size])
+        self.buffered = 0
+
+    def finish(self, score, best_score):
+        # Keeps the recording only if it beat the stored best
+        self.flush()
+        self.file.seek(0)
+        self.file.write(GHOST_HEADER.pack(GHOST_MAGIC, score, self.ticks))
+        self.file.close()
+        if score > best_score:
+            os.replace(self.temp_path, self.path)
+            return True
+        os.remove(self.temp_path)
+        return False
+
+    def discard(self):
+        self.file.close()
+        os.remove(self.temp_path)
+
+
+class GhostPlayer:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        magic, self.score, self.ticks = GHOST_HEADER.unpack(self.file.read(GHOST_HEADER.size))
+        if magic != GHOST_MAGIC:
+            self.file.close()
+            raise ValueError(f"'{path}' is not a ghost file")
+        self.buffer = bytearray(GHOST_CHUNK_TICKS * GHOST_RECORD.size)
+        self.available = 0
+        self.position = 0
+        self.finished = False
+        self.y = 0.0
+        self.rotation = 0.0
+        self.frame = 0
+        self.width, self.height = BIRD_ASSET_SIZE
+
+    def advance(self):
+        if self.finished:
+            return
+        if self.position >= self.available:
+            self.available = self.file.readinto(self.buffer) // GHOST_RECORD.size
+            self.position = 0
+            if self.available == 0:
+                self.finished = True
+                return
+        y, rotation, self.frame, self.width, self.height = GHOST_RECORD.unpack_from(
+            self.buffer, self.position * GHOST_RECORD.size)
+        self.y = y / 4
+        self.rotation = rotation / 10
+        self.position += 1
+
+    def close(self):
+        self.file.close()
+
+# --- Rewind Buffer ---
+# Fixed-size ring of per-tick world snapshots packed into one preallocated bytearray: scalars, bird and
+# scheduler state in a header, then a fixed number of pipe slots. The RNG state lives in a second ring and
+# is only copied on ticks that drew from rng; each frame points at the newest state written before it.
+# Clouds are cosmetic and not recorded; they respawn after resuming.
+REWIND_SCHEDULE = [("background_switch", "switch_background"), ("pipe_spawn", "spawn_pipe"),
+                   ("cloud_spawn", "spawn_cloud"), ("event_start", "trigger_event"),
+                   ("event_end", "end_random_event")]
+REWIND_FRAME = struct.Struct(
+    "<IIdIBiBhd"  # clock ticks, scheduler tick, clock now, rng state, game state, score, multiplier, gap, gravity
+    "bdddd?"  # event index, event start/end, next event, last event end, cloudy sky
+    "?dddd"  # day background, last switch, background scroll, ground x1, ground x2
+    "ddBBdddddBHddHHHH"  # bird
+    + "II" * len(REWIND_SCHEDULE)  # due tick (0: not scheduled), repeat interval
+    + "B"  # pipe count
+)
+REWIND_PIPE = struct.Struct("<dddddB")  # x, gap_y, gap_height, y_offset, time_offset, flags
+REWIND_RNG = struct.Struct("<625Id")  # Mersenne Twister words and position, gauss_next (NaN for None)
+PIPE_PASSED, PIPE_SPECIAL, PIPE_MOVING, PIPE_CONTROL = 1, 2, 4, 8
+
+
+class RewindBuffer:
+    def __init__(self, capacity, max_pipes=REWIND_MAX_PIPES):
+        self.capacity = capacity
+        self.max_pipes = max_pipes
+        self.frame_size = REWIND_FRAME.size + max_pipes * REWIND_PIPE.size
+        # Allocated on the first record, so windows that never enter debug mode don't carry the ~2 MB
+        self.data = None
+        self.rng_data = None
+        self.start = 0
+        self.frames = 0
+        self.rng_states = 0
+        self.rng_draws = -1
+
+    def clear(self):
+        self.start = 0
+        self.frames = 0
+        self.rng_draws = -1
+
+    def frame_offset(self, index):
+        return ((self.start + index) % self.capacity) * self.frame_size
+
+    def truncate(self, index):
+        # Drops every frame after index, along with the RNG states only they referred to
+        self.frames = index + 1
+        self.rng_states = REWIND_FRAME.unpack_from(self.data, self.frame_offset(index))[3] + 1
+        self.rng_draws = -1
+
+    def record(self, window):
+        if self.data is None:
+            self.data = bytearray(self.capacity * self.frame_size)
+            self.rng_data = bytearray(self.capacity * REWIND_RNG.size)
+        if window.rng.draws != self.rng_draws:
+            version, words, gauss_next = window.rng.getstate()
+            REWIND_RNG.pack_into(self.rng_data, (self.rng_states % self.capacity) * REWIND_RNG.size, *words,
+                                 math.nan if gauss_next is None else gauss_next)
+            self.rng_states += 1
+            self.rng_draws = window.rng.draws
+
+        if self.frames == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.frames += 1
+        offset = self.frame_offset(self.frames - 1)
+
+        bird = window.bird
+        scheduler = window.scheduler
+        schedule = []
+        for name, _ in REWIND_SCHEDULE:
+            entry = scheduler.entries.get(name)
+            schedule += (entry[0], entry[4]) if entry else (0, 0)
+        pipes = window.pipes[:self.max_pipes]
+        REWIND_FRAME.pack_into(
+            self.data, offset,
+            window.clock.ticks, scheduler.tick, window.clock.now, self.rng_states - 1, window.game_state.value,
+            window.score, window.score_multiplier, window.PIPE_GAP_HEIGHT, window.gravity_target,
+            RANDOM_EVENTS.index(window.current_event) if window.current_event else -1,
+            window.random_event_start_time, window.random_event_end_time, window.next_event_time,
+            window.last_event_end_time, window.is_cloudy_sky_event,
+            window.current_background_texture is window.background_day_texture,
+            window.background_last_switch_time, window.background_scroll_x, window.ground.x1, window.ground.x2,
+            bird.x, bird.y, bird.width, bird.height, bird.velocity, bird.gravity, bird.lift, bird.rotation,
+            bird.target_rotation, bird.frame, bird.frame_timer, bird.pipe_control_velocity,
+            bird.target_pipe_control_velocity, bird.direction_change_timer, bird.direction_change_interval,
+            bird.moon_rotation_timer, bird.moon_rotation_interval,
+            *schedule, len(pipes))
+        offset += REWIND_FRAME.size
+        for pipe in pipes:
+            flags = (pipe.passed * PIPE_PASSED | pipe.is_special * PIPE_SPECIAL | pipe.is_moving * PIPE_MOVING
+                     | pipe.is_pipe_control_mode * PIPE_CONTROL)
+            REWIND_PIPE.pack_into(self.data, offset, pipe.x, pipe.gap_y, pipe.gap_height,
+                                  getattr(pipe, "y_offset", 0.0), getattr(pipe, "time_offset", 0.0), flags)
+            offset += REWIND_PIPE.size
+
+    def restore(self, window, index):
+        # Puts the world back to frame index (0 is the oldest) and returns the game state it was recorded in
+        offset = self.frame_offset(index)
+        values = REWIND_FRAME.unpack_from(self.data, offset)
+        (window.clock.ticks, scheduler_tick, window.clock.now, rng_state, game_state, window.score,
+         window.score_multiplier, window.PIPE_GAP_HEIGHT, window.gravity_target, event,
+         window.random_event_start_time, window.random_event_end_time, window.next_event_time,
+         window.last_event_end_time, window.is_cloudy_sky_event, is_day, window.background_last_switch_time,
+         window.background_scroll_x, window.ground.x1, window.ground.x2) = values[:20]
+        window.current_event = RANDOM_EVENTS[event] if event >= 0 else None
+        if is_day:
+            window.current_background_texture = window.background_day_texture
+            window.previous_background_texture = window.background_night_texture
+        else:
+            window.current_background_texture = window.background_night_texture
+            window.previous_background_texture = window.background_day_texture
+
+        bird = window.bird
+        width, height = values[22:24]
+        if (width, height) != (bird.width, bird.height):
+            bird.set_size(width, height)
+        (bird.x, bird.y, bird.width, bird.height, bird.velocity, bird.gravity, bird.lift, bird.rotation,
+         bird.target_rotation, bird.frame, bird.frame_timer, bird.pipe_control_velocity,
+         bird.target_pipe_control_velocity, bird.direction_change_timer, bird.direction_change_interval,
+         bird.moon_rotation_timer, bird.moon_rotation_interval) = values[20:37]
+
+        schedule = values[37:37 + 2 * len(REWIND_SCHEDULE)]
+        window.scheduler.restore(scheduler_tick, [
+            (name, schedule[2 * i], getattr(window, method), schedule[2 * i + 1])
+            for i, (name, method) in enumerate(REWIND_SCHEDULE) if schedule[2 * i]])
+
+        window.pipes = []
+        offset += REWIND_FRAME.size
+        for _ in range(values[-1]):
+            x, gap_y, gap_height, y_offset, time_offset, flags = REWIND_PIPE.unpack_from(self.data, offset)
+            offset += REWIND_PIPE.size
+            if flags & PIPE_MOVING:
+                pipe = MovingPipe(x, y_offset, gap_height, window.rng)
+                pipe.time_offset = time_offset
+                pipe.gap_y = gap_y
+            else:
+                pipe = Pipe(x, gap_y, gap_height, bool(flags & PIPE_CONTROL), bool(flags & PIPE_SPECIAL))
+            pipe.passed = bool(flags & PIPE_PASSED)
+            window.pipes.append(pipe)
+        window.background_clouds = []
+        window.foreground_clouds = []
+
+        # Last, since rebuilding the moving pipes drew from rng
+        *words, gauss_next = REWIND_RNG.unpack_from(self.rng_data, (rng_state % self.capacity) * REWIND_RNG.size)
+        window.rng.setstate((window.rng.VERSION, tuple(words), None if math.isnan(gauss_next) else gauss_next))
+        self.rng_draws = -1
+        return GameState(game_state)
+
+
+# --- Frame Budget (GC Control) ---
+class FrameBudget:
+    def __init__(self, enabled=FRAME_BUDGET_MODE):
+        self.enabled = enabled
+        self.forced_collections = 0
+        self.safe_point_collections = 0
+
+    def freeze_startup(self):
+        # Long-lived textures, sounds and widgets never need to be scanned again
+        if self.enabled:
+            gc.collect()
+            gc.freeze()
+
+    def enter_play(self):
+        if self.enabled:
+            gc.disable()
+
+    def safe_point(self):
+        if self.enabled:
+            gc.collect()
+            gc.enable()
+            self.safe_point_collections += 1
+
+    def tick(self):
+        if self.enabled and not gc.isenabled() and gc.get_count()[0] > FRAME_BUDGET_GC_LIMIT:
+            gc.collect(0)
+            self.forced_collections += 1
+
+
+# --- Allocation Tracker ---
+# With FLAPPY_TRACE_ALLOC=1, measures allocations per frame (one tick plus its paint) with tracemalloc
+# and periodically prints which functions allocate every frame and which source lines keep growing.
+# Snapshots only see blocks that are still alive, so a temporary such as the QRect from get_hitbox()
+# cancels out of any snapshot diff. Sampled frames are therefore profiled call by call instead: each
+# function is charged with the bytes and blocks alive when it returns that were not there when it was
+# called, minus what its callees are charged with. The counters are preallocated so the profiler itself
+# doesn't show up. sys.setprofile() only covers the calling thread, so with FLAPPY_SIM_THREAD=1 the paint
+# is not profiled.
+class AllocationTracker:
+    def __init__(self, enabled=TRACE_ALLOCATIONS):
+        self.enabled = enabled
+        self.frames = 0
+        self.frame_start_size = 0
+        self.transient_bytes = deque(maxlen=ALLOC_REPORT_INTERVAL)
+        self.retained_bytes = deque(maxlen=ALLOC_REPORT_INTERVAL)
+        self.last_snapshot = None
+        self.blocks_per_frame = 0.0
+        self.profiling = False
+        self.sampled_frames = 0
+        self.sites = {}  # code object -> [bytes, blocks] allocated over the sampled frames
+        self.depth = 0
+        # Per active call: size and blocks when it started, and what its callees have been charged with
+        self.call_sizes = array.array("q", bytes(8 * ALLOC_PROFILE_DEPTH))
+        self.call_blocks = array.array("q", bytes(8 * ALLOC_PROFILE_DEPTH))
+        self.child_sizes = array.array("q", bytes(8 * ALLOC_PROFILE_DEPTH))
+        self.child_blocks = array.array("q", bytes(8 * ALLOC_PROFILE_DEPTH))
+        if enabled:
+            tracemalloc.start(5)
+            self.last_snapshot = self.take_snapshot()
+            # A sampled frame may still be profiling when the interpreter shuts down
+            atexit.register(sys.setprofile, None)
+
+    def take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ])
+
+    def tick(self):
+        if not self.enabled:
+            return
+        if self.profiling:
+            sys.setprofile(None)
+            self.profiling = False
+            self.sampled_frames += 1
+        size, peak = tracemalloc.get_traced_memory()
+        if self.frames:
+            # Peak above the starting size counts temporaries that were freed again within the frame
+            self.transient_bytes.append(peak - self.frame_start_size)
+            self.retained_bytes.append(size - self.frame_start_size)
+        self.frames += 1
+        if self.frames % ALLOC_REPORT_INTERVAL == 0:
+            self.report()
+        tracemalloc.reset_peak()
+        self.frame_start_size = tracemalloc.get_traced_memory()[0]
+        if self.frames % ALLOC_SAMPLE_INTERVAL == 0:
+            self.depth = 0
+            self.profiling = True
+            sys.setprofile(self.profile)
+
+    def profile(self, frame, event, arg):
+        # Calls already running when profiling started return below depth 0 and are skipped
+        if event == "call":
+            if self.depth < ALLOC_PROFILE_DEPTH:
+                self.call_sizes[self.depth] = tracemalloc.get_traced_memory()[0]
+                self.call_blocks[self.depth] = sys.getallocatedblocks()
+                self.child_sizes[self.depth] = 0
+                self.child_blocks[self.depth] = 0
+            self.depth += 1
+        elif event == "return" and self.depth > 0:
+            self.depth -= 1
+            depth = self.depth
+            if depth >= ALLOC_PROFILE_DEPTH:
+                return
+            size = tracemalloc.get_traced_memory()[0] - self.call_sizes[depth]
+            blocks = sys.getallocatedblocks() - self.call_blocks[depth]
+            if depth:
+                self.child_sizes[depth - 1] += size
+                self.child_blocks[depth - 1] += blocks
+            size -= self.child_sizes[depth]
+            blocks -= self.child_blocks[depth]
+            if size > 0 or blocks > 0:
+                site = self.sites.get(frame.f_code)
+                if site is None:
+                    site = self.sites[frame.f_code] = [0, 0]
+                site[0] += max(0, size)
+                site[1] += max(0, blocks)
+
+    def report(self):
+        snapshot = self.take_snapshot()
+        stats = snapshot.compare_to(self.last_snapshot, "traceback")
+        self.last_snapshot = snapshot
+        sampled = max(1, self.sampled_frames)
+        self.blocks_per_frame = sum(blocks for _, blocks in self.sites.values()) / sampled
+        print(f"Allocations over {ALLOC_REPORT_INTERVAL} frames: {self.summary()}")
+        print(f"  Allocated every frame, by function ({self.sampled_frames} profiled frames):")
+        for code, (size, blocks) in sorted(self.sites.items(), key=lambda item: item[1][0],
+                                           reverse=True)[:ALLOC_REPORT_TOP]:
+            print(f"    {blocks / sampled:6.2f} blocks/frame {size / sampled:7.0f} B/frame  "
+                  f"{code.co_filename}:{code.co_firstlineno} {code.co_name}")
+        print(f"  Retained, by source line (net growth over the {ALLOC_REPORT_INTERVAL} frames):")
+        for stat in sorted(stats, key=lambda stat: stat.count_diff, reverse=True)[:ALLOC_REPORT_TOP]:
+            frame = stat.traceback[-1]
+            print(f"    {stat.count_diff / ALLOC_REPORT_INTERVAL:+.2f} blocks/frame "
+                  f"{stat.size_diff / ALLOC_REPORT_INTERVAL:+.0f} B/frame  {frame.filename}:{frame.lineno}")
+        self.sites.clear()
+        self.sampled_frames = 0
+
+    def summary(self):
+        if not self.transient_bytes:
+            return "no frames"
+        transient = sum(self.transient_bytes) / len(self.transient_bytes)
+        retained = sum(self.retained_bytes) / len(self.retained_bytes)
+        return (f"{transient / 1024:.1f} KiB transient, {retained:+.0f} B retained, "
+                f"{self.blocks_per_frame:.1f} blocks allocated/frame")
+
+# --- Quality Governor ---
+# Watches the busy time of each frame (one simulation tick plus painting) rather than the timer interval, which
+# only shows a problem once frames are already late. Stepping down needs one bad window; stepping up needs
+# several calm ones, and twice as many each time an upgrade has to be undone straight away.
+class QualityGovernor:
+    def __init__(self, budget, setting=QUALITY_MODE):
+        self.budget = budget
+        self.adaptive = setting == "auto"
+        self.tier = 0
+        if not self.adaptive:
+            try:
+                self.tier = max(0, min(len(QUALITY_TIERS) - 1, int(setting)))
+            except ValueError:
+                print(f"Warning: Invalid quality setting '{setting}', using auto")
+                self.adaptive = True
+        self.frame_busy = 0.0
+        self.samples = []
+        self.calm_windows = 0
+        self.upgrade_windows = QUALITY_UPGRADE_WINDOWS
+        self.just_upgraded = False
+
+    def add(self, seconds):
+        self.frame_busy += seconds
+
+    def end_frame(self):
+        if not self.adaptive:
+            return
+        self.samples.append(self.frame_busy)
+        self.frame_busy = 0.0
+        if len(self.samples) < QUALITY_WINDOW_FRAMES:
+            return
+        self.samples.sort()
+        busy = self.samples[len(self.samples) * 9 // 10]
+        self.samples.clear()
+
+        if busy > self.budget * QUALITY_DEGRADE_FRACTION and self.tier < len(QUALITY_TIERS) - 1:
+            if self.just_upgraded:
+                self.upgrade_windows = min(QUALITY_MAX_UPGRADE_WINDOWS, self.upgrade_windows * 2)
+            self.tier += 1
+            self.calm_windows = 0
+            self.just_upgraded = False
+            return
+        self.just_upgraded = False
+        if busy < self.budget * QUALITY_UPGRADE_FRACTION and self.tier > 0:
+            self.calm_windows += 1
+            if self.calm_windows >= self.upgrade_windows:
+                self.tier -= 1
+                self.calm_windows = 0
+                self.just_upgraded = True
+        else:
+            self.calm_windows = 0
+
+    def summary(self):
+        return f"{self.tier} {QUALITY_TIERS[self.tier]}{'' if self.adaptive else ' (fixed)'}"
+
+# --- Latency Statistics ---
+class LatencyStats:
+    def __init__(self, max_samples=INPUT_LATENCY_SAMPLES):
+        self.samples = deque(maxlen=max_samples)
+        self.total_samples = 0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.total_samples += 1
+
+    def percentile(self, p):
+        return percentile(self.samples, p)
+
+    def report(self):
+        return (f"p50 {self.percentile(50) * 1000:.1f} ms / p99 {self.percentile(99) * 1000:.1f} ms "
+                f"({self.total_samples} samples)")
+
+# --- Simulation Thread ---
+# Steps the window's world at a fixed rate off the GUI thread. Commands forwarded by the GUI thread run between
+# ticks. After each step the newest FrameSnapshot is published by replacing one reference: frames are immutable,
+# so the reader always gets a complete frame and neither side ever waits, which is what a triple buffer gives
+# without copying into shared buffers.
+class SimulationThread:
+    def __init__(self, window):
+        self.window = window
+        self.commands = deque()
+        self.latest_frame = None
+        self.published = 0
+        self.resyncs = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        # Publish the current state first so the GUI never paints before the worker's first tick
+        self.latest_frame = self.window.capture_frame()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        window = self.window
+        interval = window.TICK_INTERVAL / 1000
+        next_tick = time.perf_counter()
+        while not self.stop_event.is_set():
+            while self.commands:
+                command, args = self.commands.popleft()
+                command(*args)
+            for _ in range(window.clock.frame_ticks()):
+                window.update_game()
+            self.latest_frame = window.capture_frame()
+            self.published += 1
+
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self.stop_event.wait(delay)
+            elif delay < -interval * SIMULATION_MAX_LAG_TICKS:
+                next_tick = time.perf_counter()
+                self.resyncs += 1
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+
 # --- Main Game Window ---
 class GameWindow(QMainWindow):
+    gui_call = pyqtSignal(object)  # (callable, args) queued from the simulation thread to the GUI thread
+
     # --- UI and Game-Specific Hardcoded Values ---
     GAME_OVER_TEXT_Y = 100
     MESSAGE_IMAGE_Y = 50
@@ -343,9 +1388,12 @@ class GameWindow(QMainWindow):
     EVENT_TEXT_Y = WINDOW_HEIGHT - 55
     EVENT_TEXT_WIDTH = WINDOW_WIDTH - 40
     PAUSED_TEXT = "PAUSED"
+    REWIND_TEXT_Y = 90
+    HUD_TOP = WINDOW_HEIGHT - 90  # Top of the bottom HUD text, which the "cached HUD" tier renders once
     LEADERBOARD_INFO_Y = 360
     LEADERBOARD_Y_OFFSET = 20
     PIPE_SPAWN_INTERVAL = 1500  # ms
+    TICK_INTERVAL = 16  # ms
     BIRD_START_X = 50
     BIRD_START_Y = 200
     BIRD_BOUNCE_Y_OFFSET = 5
@@ -355,6 +1403,8 @@ class GameWindow(QMainWindow):
     HITBOX_MARGIN = 5
     PIPE_GAP_MIN_Y = 60
 
+    SIZE_CHANGER_FACTOR = 1.5
+
     # Event-specific Pipe Gap Height for Moon Gravity
     MOON_GRAVITY_PIPE_GAP_HEIGHT = 120
 
@@ -375,8 +1425,13 @@ class GameWindow(QMainWindow):
     CLOUD_SPAWN_INTERVAL_MIN = 80  # milliseconds
     CLOUD_SPAWN_INTERVAL_MAX = 220
 
-    def __init__(self):
+    def __init__(self, display_scale=None, threaded=None, frame_budget=None, clock=game_clock, rng=rng,
+                 cloud_rng=cloud_rng):
         super().__init__()
+        # Simulation time and randomness; hosts running several windows in one process give each its own
+        self.clock = clock
+        self.rng = rng
+        self.cloud_rng = cloud_rng
         self.setWindowTitle("Flappy Bird: EXTENDED")
 
         # New: Set the window icon
@@ -386,9 +1441,11 @@ class GameWindow(QMainWindow):
         else:
             print(f"Warning: Icon file not found at '{icon_path}'")
 
-        self.setFixedSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.display_scale = resolve_display_scale(DISPLAY_SCALE if display_scale is None else display_scale)
+        self.setFixedSize(round(WINDOW_WIDTH * self.display_scale), round(WINDOW_HEIGHT * self.display_scale))
+        asset_cache.set_scale(self.display_scale * self.devicePixelRatioF())
 
-        pygame.mixer.init()
+        sound_bank.init_mixer()
 
         self.original_bird_size = BIRD_ASSET_SIZE
         self.original_lift = LIFT
@@ -398,24 +1455,28 @@ class GameWindow(QMainWindow):
 
         self.gravity_target = GRAVITY
 
-        self.background_day_texture = QPixmap(BACKGROUND_DAY).scaled(WINDOW_WIDTH + 1, WINDOW_HEIGHT + 1,
-                                                                     Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-        self.background_night_texture = QPixmap(BACKGROUND_NIGHT).scaled(WINDOW_WIDTH + 1, WINDOW_HEIGHT + 1,
-                                                                         Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self.background_day_texture = asset_cache.pixmap(BACKGROUND_DAY, WINDOW_WIDTH + 1, WINDOW_HEIGHT + 1,
+                                                         transform_mode=Qt.SmoothTransformation)
+        self.background_night_texture = asset_cache.pixmap(BACKGROUND_NIGHT, WINDOW_WIDTH + 1, WINDOW_HEIGHT + 1,
+                                                           transform_mode=Qt.SmoothTransformation)
 
         self.current_background_texture = self.background_day_texture
         self.previous_background_texture = self.background_night_texture
         self.background_scroll_x = 0
-        self.background_last_switch_time = time.time()
+        self.background_last_switch_time = self.clock.now
 
-        self.game_over_image = QPixmap(GAME_OVER_PATH).scaledToWidth(int(WINDOW_WIDTH * 0.8))
-        self.message_image = QPixmap(MESSAGE_PATH).scaledToWidth(int(WINDOW_WIDTH * 0.8))
-        self.number_sprites = [QPixmap(os.path.join(SPRITES_PATH, f"{i}.png")) for i in range(10)]
+        self.game_over_image = asset_cache.pixmap(GAME_OVER_PATH, int(WINDOW_WIDTH * 0.8))
+        self.message_image = asset_cache.pixmap(MESSAGE_PATH, int(WINDOW_WIDTH * 0.8))
+        self.number_sprites = [asset_cache.pixmap(os.path.join(SPRITES_PATH, f"{i}.png")) for i in range(10)]
+        self.use_atlas = SPRITE_ATLAS
+        if self.use_atlas:
+            sprite_atlas.ensure()
 
         self.game_state = GameState.MAIN_MENU
-        self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, "red")
+        self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, "red", self.rng)
         self.pipes = []
         self.score = 0
+        self.death_cause = None
         self.debug_mode = DEBUG_MODE
         self.debug_toggle_timer = QTimer(self)
         self.debug_toggle_timer.setSingleShot(True)
@@ -423,14 +1484,58 @@ class GameWindow(QMainWindow):
 
         self.events_enabled = True
 
+        # GC state is process-wide, so hosts running several windows pass in a disabled budget and own the real one
+        self.frame_budget = frame_budget or FrameBudget()
+        self.allocation_tracker = AllocationTracker()
+
+        self.input_queue = InputQueue()
+        self.input_latency = LatencyStats()
+        # (tick applied, input timestamp); only drained by paintEvent, and bounded so headless or hidden windows
+        # don't accumulate inputs forever
+        self.pending_input_timestamps = deque(maxlen=INPUT_LATENCY_SAMPLES)
+
+        self.spectator = None
+        if SPECTATOR_TARGETS:
+            from spectator import SpectatorBroadcaster
+            self.spectator = SpectatorBroadcaster(SPECTATOR_TARGETS, RANDOM_EVENTS)
+
         self.ground = Ground()
 
-        self.pipe_spawn_timer = QTimer(self)
-        self.pipe_spawn_timer.timeout.connect(self.spawn_pipe)
+        # Pipe and cloud spawns, random events and the day/night cycle run on simulation ticks
+        self.scheduler = TickScheduler(self.TICK_INTERVAL / 1000)
+
+        self.rewind_buffer = RewindBuffer(int(REWIND_SECONDS * 1000 / self.TICK_INTERVAL))
+        self.rewind_position = None  # Frame shown while scrubbing, None during normal play
+        self.rewind_game_state = None
+
+        self.quality = QualityGovernor(self.TICK_INTERVAL / 1000)
+        self.cloud_spawns = 0
+        self.blended_background = None
+        self.blended_background_key = None
+        self.hud_cache = None
+        self.hud_cache_key = None
+
+        self.last_frame_time = None
+        if TELEMETRY_DIR:
+            telemetry.start(TELEMETRY_DIR, TELEMETRY_FLUSH_SECONDS)
+
+        # Frame pacing (paint to paint) and tick regularity (tick to tick), reported on close in both modes
+        self.frame_intervals = LatencyStats(PACING_SAMPLES)
+        self.tick_intervals = LatencyStats(PACING_SAMPLES)
+        self.last_paint_time = None
+        self.last_tick_time = None
+        self.ticks_run = 0
+        self.painted_tick = None
+        self.repeated_frames = 0
+        self.skipped_ticks = 0
+
+        self.simulation = None
+        self.gui_call.connect(self.run_gui_call)
+        threaded = SIMULATION_THREAD if threaded is None else threaded
 
         self.main_game_timer = QTimer(self)
-        self.main_game_timer.timeout.connect(self.update_game)
-        self.main_game_timer.start(16)
+        self.main_game_timer.timeout.connect(self.present_frame if threaded else self.run_frame)
+        self.main_game_timer.start(self.TICK_INTERVAL)
 
         # Removed inverse_gravity flag
         self.size_changer = False
@@ -438,12 +1543,10 @@ class GameWindow(QMainWindow):
         self.is_cloudy_sky_event = False
         self.background_clouds = []
         self.foreground_clouds = []
-        self.cloud_spawn_timer = QTimer(self)
-        self.cloud_spawn_timer.timeout.connect(self.spawn_cloud)
 
         self.pipe_control_pipes = []
 
-        self.skins = ["red", "blue", "yellow"]
+        self.skins = BIRD_SKINS
         self.current_skin_index = 0
 
         self.current_menu_mode = GameState.ADVENTURE_MODE
@@ -451,11 +1554,19 @@ class GameWindow(QMainWindow):
         self.leaderboard = self.load_leaderboard()
         self.score_multiplier = 1
 
+        self.random_event_start_time = 0
         self.random_event_end_time = 0
         self.current_event = None
-        self.next_event_time = time.time() + random.uniform(self.EVENT_INTERVAL_MIN, self.EVENT_INTERVAL_MAX)
+        self.next_event_time = self.clock.now + self.rng.uniform(self.EVENT_INTERVAL_MIN, self.EVENT_INTERVAL_MAX)
         self.event_timer_active = False
-        self.last_event_end_time = time.time()
+        self.last_event_end_time = self.clock.now
+
+        self.scheduler.schedule("background_switch", self.BACKGROUND_CYCLE_SECONDS, self.switch_background, repeat=True)
+
+        self.record_ghosts = True
+        self.ghost_recorder = None
+        self.ghost_player = None
+        self.ghost_bird = None
 
         self.game_over_timer = QTimer(self)
         self.game_over_timer.setSingleShot(True)
@@ -476,6 +1587,26 @@ class GameWindow(QMainWindow):
         # Ensure the 'data' directory exists for the leaderboard file
         os.makedirs(os.path.dirname(LEADERBOARD_FILE), exist_ok=True)
 
+        self.frame_budget.freeze_startup()
+
+        if threaded:
+            self.preload_simulation_assets()
+            self.simulation = SimulationThread(self)
+            self.simulation.start()
+
+    def preload_simulation_assets(self):
+        # QPixmaps may only be created on the GUI thread, so everything the simulation can ask the asset cache
+        # for (birds at both sizes, pipes, clouds) is loaded here first and only ever hit from the worker
+        size_changer_size = (int(BIRD_ASSET_SIZE[0] * self.SIZE_CHANGER_FACTOR),
+                             int(BIRD_ASSET_SIZE[1] * self.SIZE_CHANGER_FACTOR))
+        for skin in self.skins:
+            Bird(self.BIRD_START_X, self.BIRD_START_Y, skin, self.rng).load_sprites(size_changer_size)
+        for is_special in [False, True]:
+            Pipe(WINDOW_WIDTH, 0, self.PIPE_GAP_HEIGHT, is_special=is_special)
+        for config in self.cloud_configs:
+            Cloud(WINDOW_WIDTH, 0, 0, config["opacity"], config["size_factor"], config["sprite_path"],
+                  clock=self.clock, rng=self.cloud_rng)
+
     def load_leaderboard(self):
         try:
             if os.path.exists(LEADERBOARD_FILE):
@@ -510,49 +1641,92 @@ class GameWindow(QMainWindow):
             if ok and text:
                 self.save_score(text, self.score)
 
-        self.restart_game()
+        self.run_on_simulation(self.restart_game)
 
     def start_game(self, game_mode):
         self.game_state = game_mode
         self.score = 0
-        self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.skins[self.current_skin_index])
+        self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.skins[self.current_skin_index], self.rng)
+        self.start_ghost(game_mode)
+        self.frame_budget.enter_play()
         self.pipes = []
-        self.pipe_spawn_timer.start(self.PIPE_SPAWN_INTERVAL)
-        self.next_event_time = time.time() + random.uniform(self.EVENT_INTERVAL_MIN, self.EVENT_INTERVAL_MAX)
-        self.last_event_end_time = time.time()
+        self.rewind_buffer.clear()
+        self.scheduler.schedule("pipe_spawn", self.PIPE_SPAWN_INTERVAL / 1000, self.spawn_pipe, repeat=True)
+        self.schedule_next_event()
+
+    def start_ghost(self, game_mode):
+        self.stop_ghost()
+        path = ghost_path(game_mode, self.bird.color)
+        if os.path.exists(path):
+            try:
+                self.ghost_player = GhostPlayer(path)
+                self.ghost_bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.bird.color, self.rng)
+            except (IOError, ValueError, struct.error) as e:
+                print(f"Error loading ghost: {e}")
+        if not self.record_ghosts:
+            return
+        try:
+            self.ghost_recorder = GhostRecorder(path)
+        except IOError as e:
+            print(f"Error recording ghost: {e}")
+
+    def stop_ghost(self, score=None):
+        best_score = 0
+        if self.ghost_player:
+            best_score = self.ghost_player.score
+            self.ghost_player.close()
+            self.ghost_player = None
+        if self.ghost_recorder:
+            try:
+                if score is None:
+                    self.ghost_recorder.discard()
+                else:
+                    self.ghost_recorder.finish(score, best_score)
+            except IOError as e:
+                print(f"Error saving ghost: {e}")
+            self.ghost_recorder = None
 
     def spawn_pipe(self):
         if self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
             # New: Check for a moving pipe spawn chance
-            if self.game_state == GameState.ADVENTURE_MODE and random.random() < MOVING_PIPE_CHANCE:
-                gap_y = random.randint(self.PIPE_GAP_MIN_Y,
+            if self.game_state == GameState.ADVENTURE_MODE and self.rng.random() < MOVING_PIPE_CHANCE:
+                gap_y = self.rng.randint(self.PIPE_GAP_MIN_Y,
                                        WINDOW_HEIGHT - GROUND_HEIGHT - MOVING_PIPE_GAP - self.PIPE_GAP_MIN_Y)
-                new_pipe = MovingPipe(WINDOW_WIDTH, gap_y, MOVING_PIPE_GAP)
+                new_pipe = MovingPipe(WINDOW_WIDTH, gap_y, MOVING_PIPE_GAP, self.rng)
                 self.pipes.append(new_pipe)
+                telemetry.count(METRIC_PIPES_SPAWNED)
 
                 # New: Check for a second moving pipe
-                if random.random() < DOUBLE_MOVING_PIPE_CHANCE:
-                    gap_y_2 = random.randint(self.PIPE_GAP_MIN_Y,
+                if self.rng.random() < DOUBLE_MOVING_PIPE_CHANCE:
+                    gap_y_2 = self.rng.randint(self.PIPE_GAP_MIN_Y,
                                              WINDOW_HEIGHT - GROUND_HEIGHT - MOVING_PIPE_GAP - self.PIPE_GAP_MIN_Y)
-                    new_pipe_2 = MovingPipe(WINDOW_WIDTH + PIPE_WIDTH + 100, gap_y_2, MOVING_PIPE_GAP)
+                    new_pipe_2 = MovingPipe(WINDOW_WIDTH + PIPE_WIDTH + 100, gap_y_2, MOVING_PIPE_GAP, self.rng)
                     self.pipes.append(new_pipe_2)
+                    telemetry.count(METRIC_PIPES_SPAWNED)
             else:
                 # Original pipe spawning logic
                 min_gap_y = self.PIPE_GAP_MIN_Y
                 max_gap_y = WINDOW_HEIGHT - GROUND_HEIGHT - self.PIPE_GAP_HEIGHT - self.PIPE_GAP_MIN_Y
-                gap_y = random.randint(min_gap_y, max_gap_y)
+                gap_y = self.rng.randint(min_gap_y, max_gap_y)
 
-                is_special = random.random() < SPECIAL_PIPE_CHANCE
+                is_special = self.rng.random() < SPECIAL_PIPE_CHANCE
 
                 new_pipe = Pipe(WINDOW_WIDTH, gap_y, self.PIPE_GAP_HEIGHT,
                                 is_pipe_control_mode=(self.game_state == GameState.PIPE_CONTROL_MODE),
                                 is_special=is_special)
                 self.pipes.append(new_pipe)
+                telemetry.count(METRIC_PIPES_SPAWNED)
 
     def spawn_cloud(self):
         if self.is_cloudy_sky_event:
-            config = random.choice(self.cloud_configs)
-            y = random.randint(0, WINDOW_HEIGHT // 2)
+            self.cloud_spawns += 1
+            if self.quality.tier >= 3 and self.cloud_spawns % QUALITY_CLOUD_SPAWN_DIVISOR:
+                return
+            configs = self.cloud_configs
+            if self.quality.tier >= 2:
+                configs = [configs[index] for index in QUALITY_CLOUD_LAYERS]
+            config = self.cloud_rng.choice(configs)
+            y = self.cloud_rng.randint(0, WINDOW_HEIGHT // 2)
 
             # Select animation type based on z_index
             animation_type = "y_ease" if config["z_index"] == 0 else "alpha_ease"
@@ -566,7 +1740,9 @@ class GameWindow(QMainWindow):
                 config["opacity"],
                 config["size_factor"],
                 sprite_path,
-                animation_type
+                animation_type,
+                self.clock,
+                self.cloud_rng
             )
 
             if config["z_index"] == 0:
@@ -576,80 +1752,189 @@ class GameWindow(QMainWindow):
 
     def _toggle_debug_mode(self):
         self.debug_mode = not self.debug_mode
-        self.update()
+        self.request_repaint()
 
     def keyPressEvent(self, event):
-        if self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
-            if event.key() == Qt.Key_Space:
-                self.bird.flap()
+        if event.key() == Qt.Key_Space:
+            if self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
+                self.input_queue.push("flap")
+        elif event.key() == Qt.Key_B:
+            if not self.debug_toggle_timer.isActive():
+                self.debug_toggle_timer.start(500)
+        else:
+            # The remaining keys change the world, so with a simulation thread they run between its ticks
+            self.run_on_simulation(self.handle_key, event.key(), event.modifiers())
 
+    def handle_key(self, key, modifiers):
         if self.debug_mode:
-            if event.key() == Qt.Key_1:
+            if key == Qt.Key_1:
                 # Changed from Inverse Gravity to Moon Gravity
                 self.trigger_event("Moon Gravity")
-            elif event.key() == Qt.Key_2:
+            elif key == Qt.Key_2:
                 self.trigger_event("Size Changer")
-            elif event.key() == Qt.Key_3:
+            elif key == Qt.Key_3:
                 self.trigger_event("Double Score")
-            elif event.key() == Qt.Key_4:
+            elif key == Qt.Key_4:
                 self.trigger_event("Cloudy Sky")
-
-        if event.key() == Qt.Key_P:
-            if self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
+            elif key == Qt.Key_BracketLeft:
+                self.step_time_scale(-1)
+            elif key == Qt.Key_BracketRight:
+                self.step_time_scale(1)
+            elif key in [Qt.Key_Left, Qt.Key_Right]:
+                step = REWIND_FAST_STEP if modifiers & Qt.ShiftModifier else 1
+                self.scrub_rewind(-step if key == Qt.Key_Left else step)
+            elif key in [Qt.Key_Return, Qt.Key_Enter]:
+                self.resume_from_rewind()
+
+        if key == Qt.Key_P:
+            if self.rewind_position is not None:
+                self.resume_from_rewind()
+            elif self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
                 self.game_state = GameState.PAUSED
-                self.pipe_spawn_timer.stop()
-                self.cloud_spawn_timer.stop()
+                self.clock.paused = True
+                self.input_queue.clear()
+                self.frame_budget.safe_point()
             elif self.game_state == GameState.PAUSED:
                 if not self.pipes and self.current_menu_mode == GameState.PIPE_CONTROL_MODE:
                     self.game_state = GameState.PIPE_CONTROL_MODE
                 else:
                     self.game_state = GameState.ADVENTURE_MODE
-                self.pipe_spawn_timer.start(self.PIPE_SPAWN_INTERVAL)
-                if self.is_cloudy_sky_event:
-                    self.cloud_spawn_timer.start(
-                        random.randint(self.CLOUD_SPAWN_INTERVAL_MIN, self.CLOUD_SPAWN_INTERVAL_MAX))
-        elif event.key() == Qt.Key_B:
-            if not self.debug_toggle_timer.isActive():
-                self.debug_toggle_timer.start(500)
-        elif event.key() == Qt.Key_E:
+                self.clock.paused = False
+                self.frame_budget.enter_play()
+                self.resume_events()
+        elif key == Qt.Key_E:
             self.events_enabled = not self.events_enabled
-            if not self.events_enabled and self.current_event:
-                self.end_random_event()
-            self.update()
-        elif event.key() == Qt.Key_R and self.game_state == GameState.GAME_OVER:
+            if not self.events_enabled:
+                if self.current_event:
+                    self.end_random_event()
+                self.scheduler.cancel("event_start")
+            else:
+                self.schedule_next_event()
+            self.request_repaint()
+        elif key == Qt.Key_R and self.game_state == GameState.GAME_OVER:
             self.restart_game()
-        elif event.key() == Qt.Key_S and self.game_state == GameState.MAIN_MENU:
+        elif key == Qt.Key_S and self.game_state == GameState.MAIN_MENU:
             self.current_skin_index = (self.current_skin_index + 1) % len(self.skins)
-            self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.skins[self.current_skin_index])
-        elif event.key() == Qt.Key_C and self.game_state == GameState.MAIN_MENU:
+            self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.skins[self.current_skin_index], self.rng)
+        elif key == Qt.Key_C and self.game_state == GameState.MAIN_MENU:
             if self.current_menu_mode == GameState.ADVENTURE_MODE:
                 self.current_menu_mode = GameState.PIPE_CONTROL_MODE
             else:
                 self.current_menu_mode = GameState.ADVENTURE_MODE
-            self.update()
+            self.request_repaint()
+
+    def step_time_scale(self, direction):
+        steps = TIME_SCALE_STEPS
+        index = min(range(len(steps)), key=lambda i: abs(steps[i] - self.clock.time_scale))
+        self.clock.time_scale = steps[max(0, min(len(steps) - 1, index + direction))]
+        self.request_repaint()
+
+    def scrub_rewind(self, step):
+        buffer = self.rewind_buffer
+        if self.rewind_position is None:
+            if not buffer.frames or self.game_state not in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE,
+                                                            GameState.PAUSED, GameState.GAME_OVER]:
+                return
+            # The first press freezes the game on the newest snapshot
+            self.run_on_gui(self.game_over_timer.stop)
+            self.input_queue.clear()
+            self.clock.paused = True
+            self.frame_budget.safe_point()
+            self.rewind_position = buffer.frames - 1
+        else:
+            self.rewind_position = max(0, min(buffer.frames - 1, self.rewind_position + step))
+        self.rewind_game_state = buffer.restore(self, self.rewind_position)
+        self.game_state = GameState.PAUSED
+        self.request_repaint()
+
+    def resume_from_rewind(self):
+        if self.rewind_position is None:
+            return
+        self.rewind_buffer.truncate(self.rewind_position)
+        self.rewind_position = None
+        # The run no longer matches what was recorded or replayed
+        self.stop_ghost()
+        self.game_state = self.rewind_game_state
+        self.clock.paused = False
+        self.frame_budget.enter_play()
+        self.resume_events()
+        self.request_repaint()
 
     def mouseMoveEvent(self, event):
-        if self.game_state == GameState.PIPE_CONTROL_MODE and self.pipes:
-            mouse_y = event.y()
-            closest_pipe = self.pipes[0]
-            if closest_pipe.x < self.bird.x:
-                if len(self.pipes) > 1:
-                    closest_pipe = self.pipes[1]
-                else:
-                    return
+        if self.game_state == GameState.PIPE_CONTROL_MODE:
+            self.input_queue.push_mouse_move(int(event.y() / self.display_scale))
 
-            min_gap_y = self.PIPE_GAP_MIN_Y
-            max_gap_y = WINDOW_HEIGHT - GROUND_HEIGHT - self.PIPE_GAP_HEIGHT - self.PIPE_GAP_MIN_Y
+    def move_closest_pipe(self, mouse_y):
+        if not self.pipes:
+            return
+        closest_pipe = self.pipes[0]
+        if closest_pipe.x < self.bird.x:
+            if len(self.pipes) > 1:
+                closest_pipe = self.pipes[1]
+            else:
+                return
+
+        min_gap_y = self.PIPE_GAP_MIN_Y
+        max_gap_y = WINDOW_HEIGHT - GROUND_HEIGHT - self.PIPE_GAP_HEIGHT - self.PIPE_GAP_MIN_Y
 
-            closest_pipe.gap_y = max(min_gap_y, min(max_gap_y, mouse_y - self.PIPE_GAP_HEIGHT / 2))
+        closest_pipe.gap_y = max(min_gap_y, min(max_gap_y, mouse_y - self.PIPE_GAP_HEIGHT / 2))
 
     def mousePressEvent(self, event):
         if self.game_state == GameState.MAIN_MENU:
-            pygame.mixer.Sound(AUDIO_SWOOSH).play()
-            self.start_game(self.current_menu_mode)
+            self.run_on_simulation(self.start_from_menu)
         elif self.game_state == GameState.ADVENTURE_MODE:
-            self.bird.flap()
-        self.update()
+            self.input_queue.push("flap")
+        self.request_repaint()
+
+    def start_from_menu(self):
+        if self.game_state == GameState.MAIN_MENU:
+            sound_bank.play(AUDIO_SWOOSH)
+            self.start_game(self.current_menu_mode)
+
+    def run_on_simulation(self, command, *args):
+        if self.simulation is None:
+            command(*args)
+        else:
+            self.simulation.commands.append((command, args))
+
+    def run_on_gui(self, command, *args):
+        # Timers and dialogs belong to the GUI thread; from the simulation thread the call is queued there
+        if self.simulation is None:
+            command(*args)
+        else:
+            self.gui_call.emit((command, args))
+
+    def run_gui_call(self, call):
+        command, args = call
+        command(*args)
+
+    def request_repaint(self):
+        # With a simulation thread the GUI repaints on its own timer, and update() is GUI-thread only
+        if self.simulation is None:
+            self.update()
+
+    def apply_inputs(self):
+        for timestamp, action, value in self.input_queue.drain():
+            if action == "flap":
+                self.bird.flap()
+            elif action == "pipe_move":
+                self.move_closest_pipe(value)
+            self.pending_input_timestamps.append((self.ticks_run, timestamp))
+
+    def closeEvent(self, event):
+        if self.simulation:
+            self.simulation.stop()
+        self.stop_ghost()
+        telemetry.stop()
+        print(f"Input-to-photon latency: {self.input_latency.report()}")
+        print(f"Frame pacing: {self.frame_intervals.report()}, {self.repeated_frames} frames repeated, "
+              f"{self.skipped_ticks} ticks never shown")
+        resyncs = f", {self.simulation.resyncs} resyncs" if self.simulation else ""
+        print(f"Tick regularity ({'simulation thread' if self.simulation else 'GUI thread'}): "
+              f"{self.tick_intervals.report()}{resyncs}")
+        if self.spectator:
+            print(f"Spectator broadcast: {self.spectator.report()}")
+        super().closeEvent(event)
 
     def keyReleaseEvent(self, event):
         if event.key() == Qt.Key_B:
@@ -657,41 +1942,84 @@ class GameWindow(QMainWindow):
                 self.debug_toggle_timer.stop()
 
     def paintEvent(self, event):
+        paint_start = time.perf_counter()
+        frame = self.latest_frame()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        time_since_switch = time.time() - self.background_last_switch_time
-
-        painter.save()
-
-        if self.current_background_texture == self.background_day_texture:
-            fading_in_texture = self.background_day_texture
-            fading_out_texture = self.background_night_texture
+        # Assets are pre-scaled by the same factor, so this only maps logical coordinates to the window
+        painter.scale(self.display_scale, self.display_scale)
+        self.render_scene(painter, frame)
+        painter.end()
+        now = time.perf_counter()
+        paint_time = now - paint_start
+        telemetry.observe(METRIC_PAINT_TIME, paint_time)
+        self.quality.add(paint_time)
+
+        if self.last_paint_time is not None:
+            self.frame_intervals.add(now - self.last_paint_time)
+        self.last_paint_time = now
+        if self.painted_tick is not None:
+            if frame.tick == self.painted_tick:
+                self.repeated_frames += 1
+            else:
+                self.skipped_ticks += frame.tick - self.painted_tick - 1
+        self.painted_tick = frame.tick
+
+        # The first painted frame that includes the tick an input was applied on closes its latency sample. With a
+        # simulation thread the input may be applied before that tick's frame is published; popleft() because
+        # that thread may be appending
+        pending = self.pending_input_timestamps
+        while pending and pending[0][0] <= frame.tick:
+            self.input_latency.add(now - pending.popleft()[1])
+
+    def latest_frame(self):
+        if self.simulation:
+            return self.simulation.latest_frame
+        return self.capture_frame()
+
+    def capture_frame(self):
+        ghost = None
+        if self.ghost_player and not self.ghost_player.finished:
+            ghost_bird = self.ghost_bird
+            ghost = BirdFrame(ghost_bird.x, self.ghost_player.y, ghost_bird.width, ghost_bird.height,
+                              self.ghost_player.rotation, self.ghost_player.frame % len(ghost_bird.sprite_frames),
+                              ghost_bird.sprite_frames)
+        rewind = None
+        if self.rewind_position is not None:
+            rewind = (self.rewind_buffer.frames - 1 - self.rewind_position, self.rewind_buffer.frames)
+        return FrameSnapshot(
+            self.ticks_run, self.game_state, self.score, self.current_event, self.is_cloudy_sky_event,
+            self.event_progress(), self.current_background_texture is self.background_day_texture,
+            self.background_fade_factor(), self.background_scroll_x, self.ground.snapshot(), self.bird.snapshot(),
+            ghost, tuple(pipe.snapshot() for pipe in self.pipes),
+            tuple(cloud.snapshot() for cloud in self.background_clouds),
+            tuple(cloud.snapshot() for cloud in self.foreground_clouds), rewind)
+
+    def render_scene(self, painter, frame=None, background=True, clouds=True, hud=True):
+        # Draws one frame in logical WINDOW_WIDTH x WINDOW_HEIGHT coordinates onto any paint device. Layers can
+        # be left out for cheaper frames (pixel observations); a skipped background is cleared to black instead.
+        if frame is None:
+            frame = self.latest_frame()
+        painter.setRenderHint(QPainter.Antialiasing, self.quality.tier < 1)
+
+        if background:
+            self.draw_background(painter, frame)
         else:
-            fading_in_texture = self.background_night_texture
-            fading_out_texture = self.background_day_texture
-
-        fade_factor = min(1.0, time_since_switch / self.FADE_DURATION)
-
-        painter.setOpacity(1.0 - fade_factor)
-        painter.drawPixmap(int(self.background_scroll_x), 0, fading_out_texture)
-        painter.drawPixmap(int(self.background_scroll_x + WINDOW_WIDTH), 0, fading_out_texture)
+            painter.fillRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT, Qt.black)
 
-        painter.setOpacity(fade_factor)
-        painter.drawPixmap(int(self.background_scroll_x), 0, fading_in_texture)
-        painter.drawPixmap(int(self.background_scroll_x + WINDOW_WIDTH), 0, fading_in_texture)
-
-        painter.restore()
+        if clouds:
+            for cloud in frame.background_clouds:
+                cloud.draw(painter)
 
-        for cloud in self.background_clouds:
-            cloud.draw(painter)
-
-        for pipe in self.pipes:
-            pipe.draw(painter, WINDOW_HEIGHT, self.debug_mode)
+        if self.use_atlas:
+            sprite_atlas.ensure()
+            self.draw_world_batched(painter, frame)
+        else:
+            for pipe in frame.pipes:
+                pipe.draw(painter, WINDOW_HEIGHT, self.debug_mode)
 
-        self.ground.draw(painter, self.debug_mode)
+            frame.ground.draw(painter, self.debug_mode)
 
-        if self.is_cloudy_sky_event:
+        if frame.is_cloudy_sky_event:
             painter.setBrush(QColor(SCREEN_DARKENING_COLOR_R, SCREEN_DARKENING_COLOR_G, SCREEN_DARKENING_COLOR_B))
             painter.setOpacity(SCREEN_DARKENING_OPACITY)
             painter.drawRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -702,34 +2030,90 @@ class GameWindow(QMainWindow):
 
             painter.setOpacity(1.0)  # Reset opacity after drawing the rect
 
-        self.bird.draw(painter, self.debug_mode)
+        if frame.ghost:
+            self.draw_ghost(painter, frame.ghost)
 
-        for cloud in self.foreground_clouds:
-            cloud.draw(painter)
+        frame.bird.draw(painter, self.debug_mode)
 
-        self.draw_score_with_numbers(painter)
+        if clouds:
+            for cloud in frame.foreground_clouds:
+                cloud.draw(painter)
 
-        if self.game_state == GameState.MAIN_MENU:
-            painter.drawPixmap(int((WINDOW_WIDTH - self.message_image.width()) / 2), self.MESSAGE_IMAGE_Y,
-                               self.message_image)
+        if hud:
+            self.draw_overlays(painter, frame)
+
+    def draw_world_batched(self, painter, frame):
+        fragments = []
+        for pipe in frame.pipes:
+            pipe.add_fragments(fragments, sprite_atlas)
+        sprite_atlas.draw(painter, fragments)
+        if self.debug_mode:
+            for pipe in frame.pipes:
+                pipe.draw_hitboxes(painter, WINDOW_HEIGHT)
+
+        fragments = []
+        frame.ground.add_fragments(fragments, sprite_atlas)
+        sprite_atlas.draw(painter, fragments)
+        if self.debug_mode:
+            frame.ground.draw_hitbox(painter)
+
+    def draw_overlays(self, painter, frame):
+        self.draw_score_with_numbers(painter, frame.score)
+
+        if frame.game_state == GameState.MAIN_MENU:
+            message_x = int((WINDOW_WIDTH - pixmap_size(self.message_image)[0]) / 2)
+            if self.use_atlas:
+                sprite_atlas.draw(painter, [sprite_atlas.fragment("message", message_x, self.MESSAGE_IMAGE_Y)])
+            else:
+                painter.drawPixmap(message_x, self.MESSAGE_IMAGE_Y, self.message_image)
             self.draw_main_menu_info(painter)
             painter.setPen(QColor(0, 0, 0))
             painter.setFont(QFont("Arial", 10))
             painter.drawText(20, 30, "Toggles: E - Events, B - Debug")
 
-        elif self.game_state == GameState.GAME_OVER:
-            self.draw_leaderboard(painter)
+        elif frame.game_state == GameState.GAME_OVER:
+            self.draw_leaderboard(painter, frame.score)
 
-        if self.game_state == GameState.PAUSED:
+        if frame.rewind is not None:
+            painter.setPen(QColor(255, 255, 255))
+            painter.setFont(QFont("Arial", 14, QFont.Bold))
+            frames_back, frames = frame.rewind
+            painter.drawText(QRect(0, self.REWIND_TEXT_Y, WINDOW_WIDTH, 20), Qt.AlignCenter,
+                             f"REWIND {-frames_back} / {frames}")
+            painter.setFont(QFont("Arial", 10))
+            painter.drawText(QRect(0, self.REWIND_TEXT_Y + 20, WINDOW_WIDTH, 16), Qt.AlignCenter,
+                             "Left/Right: step, Enter: resume")
+        elif frame.game_state == GameState.PAUSED:
             painter.setPen(QColor(0, 0, 0))
             font = QFont("Arial", 36)
             font.setBold(True)
             painter.setFont(font)
-            painter.drawText(self.rect(), Qt.AlignCenter, self.PAUSED_TEXT)
+            painter.drawText(QRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT), Qt.AlignCenter, self.PAUSED_TEXT)
 
-        if self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
-            self.draw_event_bar(painter)
+        if frame.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
+            self.draw_event_bar(painter, frame)
 
+        if self.quality.tier >= 5:
+            self.draw_cached_hud(painter, frame)
+        else:
+            self.draw_hud(painter, frame)
+
+        if self.debug_mode:
+            painter.setPen(QColor(255, 255, 255))
+            painter.setFont(QFont("Arial", 10))
+            debug_legend_y = WINDOW_HEIGHT - 75
+            painter.drawText(20, debug_legend_y - 14,
+                             f"Input p50/p99: {self.input_latency.percentile(50) * 1000:.1f}/"
+                             f"{self.input_latency.percentile(99) * 1000:.1f} ms")
+            painter.drawText(20, debug_legend_y - 38, f"Quality: {self.quality.summary()}")
+            painter.drawText(20, debug_legend_y - 50,
+                             f"Frame/tick p99: {self.frame_intervals.percentile(99) * 1000:.1f}/"
+                             f"{self.tick_intervals.percentile(99) * 1000:.1f} ms"
+                             f"{' (sim thread)' if self.simulation else ''}")
+            if self.allocation_tracker.enabled:
+                painter.drawText(20, debug_legend_y - 26, f"Alloc: {self.allocation_tracker.summary()}")
+
+    def draw_hud(self, painter, frame):
         painter.setPen(QColor(255, 255, 255))
         painter.setFont(QFont("Arial", 12))
 
@@ -744,9 +2128,9 @@ class GameWindow(QMainWindow):
 
         event_rect = QRect(20, self.EVENT_TEXT_Y, self.EVENT_TEXT_WIDTH, 20)
         painter.setFont(QFont("Arial", 12, QFont.Bold))
-        if self.current_event:
+        if frame.current_event:
             painter.setPen(QColor(0, 0, 0, 150))
-            painter.drawText(event_rect, Qt.AlignCenter, f"Event: {self.current_event}")
+            painter.drawText(event_rect, Qt.AlignCenter, f"Event: {frame.current_event}")
         else:
             painter.drawText(event_rect, Qt.AlignCenter, "")
 
@@ -760,47 +2144,130 @@ class GameWindow(QMainWindow):
             painter.drawText(20, debug_legend_y + 24, "2: Size Changer")
             painter.drawText(120, debug_legend_y + 12, "3: Double Score")
             painter.drawText(120, debug_legend_y + 24, "4: Cloudy Sky")
+            painter.drawText(QRect(0, debug_legend_y - 12, WINDOW_WIDTH - 20, 14), Qt.AlignRight | Qt.AlignVCenter,
+                             f"[ ] Speed: {self.clock.time_scale:g}x")
+
+    def draw_cached_hud(self, painter, frame):
+        # The HUD text only changes with these, so it is rendered once into a pixmap instead of every frame
+        key = (self.leaderboard[0]['score'] if self.leaderboard else 0, self.debug_mode, frame.current_event,
+               self.clock.time_scale, asset_cache.scale)
+        if key != self.hud_cache_key:
+            scale = asset_cache.scale
+            self.hud_cache = QPixmap(round(WINDOW_WIDTH * scale), round((WINDOW_HEIGHT - self.HUD_TOP) * scale))
+            self.hud_cache.setDevicePixelRatio(scale)
+            self.hud_cache.fill(Qt.transparent)
+            hud_painter = QPainter(self.hud_cache)
+            hud_painter.translate(0, -self.HUD_TOP)
+            self.draw_hud(hud_painter, frame)
+            hud_painter.end()
+            self.hud_cache_key = key
+        painter.drawPixmap(0, self.HUD_TOP, self.hud_cache)
+
+    def draw_background(self, painter, frame):
+        painter.save()
+
+        if frame.background_is_day:
+            fading_in_texture = self.background_day_texture
+            fading_out_texture = self.background_night_texture
+        else:
+            fading_in_texture = self.background_night_texture
+            fading_out_texture = self.background_day_texture
+
+        fade_factor = frame.background_fade
+        scroll_x = frame.background_scroll_x
+
+        if self.quality.tier >= 4:
+            # A few blend levels are composited once each, so a frame blits one texture instead of four
+            fade_factor = round(fade_factor * QUALITY_FADE_STEPS) / QUALITY_FADE_STEPS
+            if fade_factor == 0.0:
+                blended_texture = fading_out_texture
+            elif fade_factor == 1.0:
+                blended_texture = fading_in_texture
+            else:
+                key = (fading_in_texture.cacheKey(), fade_factor)
+                if key != self.blended_background_key:
+                    self.blended_background = QPixmap(fading_in_texture.size())
+                    self.blended_background.setDevicePixelRatio(fading_in_texture.devicePixelRatio())
+                    self.blended_background.fill(Qt.transparent)
+                    blend_painter = QPainter(self.blended_background)
+                    blend_painter.setOpacity(1.0 - fade_factor)
+                    blend_painter.drawPixmap(0, 0, fading_out_texture)
+                    blend_painter.setOpacity(fade_factor)
+                    blend_painter.drawPixmap(0, 0, fading_in_texture)
+                    blend_painter.end()
+                    self.blended_background_key = key
+                blended_texture = self.blended_background
+            painter.drawPixmap(int(scroll_x), 0, blended_texture)
+            painter.drawPixmap(int(scroll_x + WINDOW_WIDTH), 0, blended_texture)
+            painter.restore()
+            return
+
+        painter.setOpacity(1.0 - fade_factor)
+        painter.drawPixmap(int(scroll_x), 0, fading_out_texture)
+        painter.drawPixmap(int(scroll_x + WINDOW_WIDTH), 0, fading_out_texture)
+
+        painter.setOpacity(fade_factor)
+        painter.drawPixmap(int(scroll_x), 0, fading_in_texture)
+        painter.drawPixmap(int(scroll_x + WINDOW_WIDTH), 0, fading_in_texture)
+
+        painter.restore()
 
-    def draw_event_bar(self, painter):
+    def draw_ghost(self, painter, ghost):
+        painter.save()
+        painter.setOpacity(GHOST_OPACITY)
+        ghost.draw(painter)
+        painter.restore()
+
+    def background_fade_factor(self):
+        time_since_switch = self.clock.now - self.background_last_switch_time
+        return min(1.0, time_since_switch / self.FADE_DURATION)
+
+    def event_progress(self):
+        # Fraction of the current event elapsed, or of the wait for the next one
+        if self.current_event:
+            elapsed = self.clock.now - self.random_event_start_time
+            total_duration = self.random_event_end_time - self.random_event_start_time
+            return elapsed / total_duration
+        time_until_event = self.next_event_time - self.clock.now
+        total_interval = self.next_event_time - self.last_event_end_time
+        if time_until_event > 0 and total_interval > 0:
+            return max(0, 1 - (time_until_event / total_interval))
+        return 0
+
+    def draw_event_bar(self, painter, frame):
         max_bar_width = WINDOW_WIDTH - 40
         bar_height = 10
         x_pos = 20
         y_pos = 10
 
-        if self.current_event:
-            elapsed = time.time() - self.random_event_start_time
-            total_duration = self.random_event_end_time - self.random_event_start_time
-            progress = (elapsed / total_duration)
-
-            bar_width = int(max_bar_width * progress)
+        bar_width = int(max_bar_width * frame.event_progress)
+        if frame.current_event:
             painter.setBrush(QColor(255, 215, 0))
-            painter.drawRect(x_pos, y_pos, bar_width, bar_height)
         else:
-            time_until_event = self.next_event_time - time.time()
-            total_interval = self.next_event_time - self.last_event_end_time
-            if time_until_event > 0 and total_interval > 0:
-                progress = 1 - (time_until_event / total_interval)
-                progress = max(0, progress)
-                bar_width = int(max_bar_width * progress)
-                painter.setBrush(QColor(135, 206, 235))
-                painter.drawRect(x_pos, y_pos, bar_width, bar_height)
-            else:
-                painter.setBrush(QColor(135, 206, 235))
-                painter.drawRect(x_pos, y_pos, 0, bar_height)
+            painter.setBrush(QColor(135, 206, 235))
+        painter.drawRect(x_pos, y_pos, bar_width, bar_height)
 
         painter.setPen(QPen(QColor(0, 0, 0), 2))
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(x_pos, y_pos, max_bar_width, bar_height)
 
-    def draw_score_with_numbers(self, painter):
-        score_str = str(self.score)
-        total_width = sum(self.number_sprites[int(digit)].width() for digit in score_str)
+    def draw_score_with_numbers(self, painter, score):
+        score_str = str(score)
+        total_width = sum(pixmap_size(self.number_sprites[int(digit)])[0] for digit in score_str)
         x_start = (WINDOW_WIDTH - total_width) / 2
 
+        if self.use_atlas:
+            fragments = []
+            for digit in score_str:
+                fragments.append(sprite_atlas.fragment(f"digit_{digit}", int(x_start), 50))
+                x_start += sprite_atlas.size(f"digit_{digit}")[0]
+            sprite_atlas.draw(painter, fragments)
+            return
+
         for digit in score_str:
             sprite = self.number_sprites[int(digit)]
             painter.drawPixmap(int(x_start), 50, sprite)
-            x_start += sprite.width()
+            x_start += pixmap_size(sprite)[0]
 
     # --- START OF IMPLEMENTED FUNCTIONS (FIX) ---
     def draw_main_menu_info(self, painter):
@@ -830,15 +2297,19 @@ class GameWindow(QMainWindow):
         painter.drawText(high_score_rect, Qt.AlignCenter, high_score_text)
 
 
-    def draw_leaderboard(self, painter):
-        game_over_x = int((WINDOW_WIDTH - self.game_over_image.width()) / 2)
-        painter.drawPixmap(game_over_x, self.GAME_OVER_TEXT_Y, self.game_over_image)
+    def draw_leaderboard(self, painter, score):
+        game_over_width, game_over_height = pixmap_size(self.game_over_image)
+        game_over_x = int((WINDOW_WIDTH - game_over_width) / 2)
+        if self.use_atlas:
+            sprite_atlas.draw(painter, [sprite_atlas.fragment("game_over", game_over_x, self.GAME_OVER_TEXT_Y)])
+        else:
+            painter.drawPixmap(game_over_x, self.GAME_OVER_TEXT_Y, self.game_over_image)
 
         painter.setPen(QColor(0, 0, 0))
         score_font = QFont("Arial", 16, QFont.Bold)
         painter.setFont(score_font)
-        score_text = f"Your Score: {self.score}"
-        score_rect = QRect(0, self.GAME_OVER_TEXT_Y + self.game_over_image.height() + 10, WINDOW_WIDTH, 30)
+        score_text = f"Your Score: {score}"
+        score_rect = QRect(0, int(self.GAME_OVER_TEXT_Y + game_over_height + 10), WINDOW_WIDTH, 30)
         painter.drawText(score_rect, Qt.AlignCenter, score_text)
 
         leaderboard_title_font = QFont("Arial", 14, QFont.Bold)
@@ -861,14 +2332,42 @@ class GameWindow(QMainWindow):
         restart_y = start_y + len(self.leaderboard) * self.LEADERBOARD_Y_OFFSET + 30
         painter.drawText(QRect(0, restart_y, WINDOW_WIDTH, 20), Qt.AlignCenter, restart_text)
 
+    def run_frame(self):
+        now = self.start_frame()
+        ticks = self.clock.frame_ticks()
+        for _ in range(ticks):
+            self.update_game()
+        # Fast-forward runs several ticks per frame, but the budget is for one tick plus its paint
+        self.quality.add((time.perf_counter() - now) / max(1, ticks))
+
+    def present_frame(self):
+        # With a simulation thread the GUI timer only repaints the newest published frame
+        self.start_frame()
+        self.update()
+
+    def start_frame(self):
+        now = time.perf_counter()
+        if self.last_frame_time is not None:
+            interval = now - self.last_frame_time
+            telemetry.observe(METRIC_FRAME_TIME, interval)
+            missed = int(interval * 1000 / self.TICK_INTERVAL) - 1
+            if missed > 0:
+                telemetry.count(METRIC_DROPPED_FRAMES, missed)
+        self.last_frame_time = now
+        self.quality.end_frame()
+        return now
+
     def update_game(self):
-        if time.time() - self.background_last_switch_time > self.BACKGROUND_CYCLE_SECONDS:
-            self.previous_background_texture = self.current_background_texture
-            if self.current_background_texture == self.background_day_texture:
-                self.current_background_texture = self.background_night_texture
-            else:
-                self.current_background_texture = self.background_day_texture
-            self.background_last_switch_time = time.time()
+        tick_start = time.perf_counter()
+        if self.last_tick_time is not None:
+            self.tick_intervals.add(tick_start - self.last_tick_time)
+        self.last_tick_time = tick_start
+        self.ticks_run += 1
+        if not self.clock.paused:
+            self.clock.advance(self.TICK_INTERVAL / 1000)
+            self.scheduler.advance()
+        self.frame_budget.tick()
+        self.allocation_tracker.tick()
 
         if self.game_state == GameState.MAIN_MENU:
             self.bird.bounce_update()
@@ -877,6 +2376,8 @@ class GameWindow(QMainWindow):
             if self.background_scroll_x <= -WINDOW_WIDTH:
                 self.background_scroll_x = 0
         elif self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
+            self.apply_inputs()
+
             if self.bird.gravity != self.gravity_target:
                 diff = self.gravity_target - self.bird.gravity
                 if abs(diff) > self.GRAVITY_TRANSITION_SPEED:
@@ -889,73 +2390,94 @@ class GameWindow(QMainWindow):
                     self.bird.lift = LIFT if self.gravity_target == GRAVITY else MOON_LIFT
 
             self.bird.update(self.game_state)
+            if self.ghost_recorder:
+                self.ghost_recorder.record(self.bird)
+            if self.ghost_player:
+                self.ghost_player.advance()
+                ghost, ghost_bird = self.ghost_player, self.ghost_bird
+                # The recorded run may have been in a Size Changer event
+                if (ghost.width, ghost.height) != (ghost_bird.width, ghost_bird.height):
+                    ghost_bird.set_size(ghost.width, ghost.height)
             self.ground.update()
             self.update_pipes()
+            if self.debug_mode:
+                # Before the collision check, so the last frame before a game over shows the hit
+                self.rewind_buffer.record(self)
             self.check_collisions()
-            self.update_events()
 
             self.background_scroll_x -= BACKGROUND_SCROLL_SPEED
             if self.background_scroll_x <= -WINDOW_WIDTH:
                 self.background_scroll_x = 0
 
             if self.is_cloudy_sky_event:
-                self.background_clouds = [cloud for cloud in self.background_clouds if cloud.x + cloud.width > 0]
-                self.foreground_clouds = [cloud for cloud in self.foreground_clouds if cloud.x + cloud.width > 0]
-                for cloud in self.background_clouds + self.foreground_clouds:
-                    cloud.update()
+                self.update_clouds(self.background_clouds)
+                self.update_clouds(self.foreground_clouds)
+
+        if self.spectator:
+            self.spectator.publish(self)
+
+        telemetry.observe(METRIC_TICK_TIME, time.perf_counter() - tick_start)
+        self.request_repaint()
+
+    def update_clouds(self, clouds):
+        # Compacts the list in place instead of building new lists every tick
+        kept = 0
+        for cloud in clouds:
+            if cloud.x + cloud.width > 0:
+                cloud.update()
+                clouds[kept] = cloud
+                kept += 1
+        del clouds[kept:]
+
+    def switch_background(self):
+        self.previous_background_texture = self.current_background_texture
+        if self.current_background_texture == self.background_day_texture:
+            self.current_background_texture = self.background_night_texture
+        else:
+            self.current_background_texture = self.background_day_texture
+        self.background_last_switch_time = self.clock.now
 
-        self.update()
+    def schedule_next_event(self):
+        self.last_event_end_time = self.clock.now
+        self.next_event_time = self.clock.now + self.rng.uniform(self.EVENT_INTERVAL_MIN, self.EVENT_INTERVAL_MAX)
+        if self.events_enabled and self.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]:
+            self.scheduler.schedule("event_start", self.next_event_time - self.clock.now, self.trigger_event)
 
-    def update_events(self):
-        if not self.events_enabled:
-            return
+    def resume_events(self):
+        # Events switched back on while paused could not be scheduled then
+        if self.events_enabled and self.current_event is None and "event_start" not in self.scheduler.entries:
+            self.schedule_next_event()
 
-        current_time = time.time()
-        if self.current_event is None and current_time >= self.next_event_time:
-            # Replaced "Inverse Gravity" with "Moon Gravity" in random choice
-            self.trigger_event(random.choice(["Moon Gravity", "Size Changer", "Double Score", "Cloudy Sky"]))
-        elif self.current_event is not None and current_time >= self.random_event_end_time:
-            self.end_random_event()
+    def cancel_play_schedule(self):
+        self.scheduler.cancel("pipe_spawn", "cloud_spawn", "event_start", "event_end")
 
     def trigger_event(self, event_name=None):
-        pygame.mixer.Sound(AUDIO_SWOOSH).play()
+        sound_bank.play(AUDIO_SWOOSH)
 
         if event_name is None:
             # Updated random choice
-            event_name = random.choice(["Moon Gravity", "Size Changer", "Double Score", "Cloudy Sky"])
+            event_name = self.rng.choice(RANDOM_EVENTS)
 
         self.current_event = event_name
-        self.random_event_start_time = time.time()
-        self.random_event_end_time = time.time() + random.uniform(self.EVENT_DURATION_MIN, self.EVENT_DURATION_MAX)
+        telemetry.count(METRIC_EVENTS + RANDOM_EVENTS.index(event_name))
+        self.random_event_start_time = self.clock.now
+        self.random_event_end_time = self.clock.now + self.rng.uniform(self.EVENT_DURATION_MIN, self.EVENT_DURATION_MAX)
+        self.scheduler.cancel("event_start")
+        self.scheduler.schedule("event_end", self.random_event_end_time - self.clock.now, self.end_random_event)
 
         if event_name != "Cloudy Sky":
             self.pipes.clear()
 
         if event_name == "Moon Gravity":
             self.gravity_target = MOON_GRAVITY
-            self.bird.target_rotation = random.uniform(-45, 45)
+            self.bird.target_rotation = self.rng.uniform(-45, 45)
             self.PIPE_GAP_HEIGHT = self.MOON_GRAVITY_PIPE_GAP_HEIGHT
 
         elif event_name == "Size Changer":
-            size_factor = 1.5
+            size_factor = self.SIZE_CHANGER_FACTOR
             new_width = self.original_bird_size[0] * size_factor
             new_height = self.original_bird_size[1] * size_factor
-            self.bird.width = int(new_width)
-            self.bird.height = int(new_height)
-            self.bird.sprite_frames = [
-                QPixmap(os.path.join(SPRITES_PATH, f"{self.bird.color}bird-upflap.png")).scaled(int(new_width),
-                                                                                                int(new_height),
-                                                                                                Qt.KeepAspectRatio,
-                                                                                                Qt.SmoothTransformation),
-                QPixmap(os.path.join(SPRITES_PATH, f"{self.bird.color}bird-midflap.png")).scaled(int(new_width),
-                                                                                                 int(new_height),
-                                                                                                 Qt.KeepAspectRatio,
-                                                                                                 Qt.SmoothTransformation),
-                QPixmap(os.path.join(SPRITES_PATH, f"{self.bird.color}bird-downflap.png")).scaled(int(new_width),
-                                                                                                  int(new_height),
-                                                                                                  Qt.KeepAspectRatio,
-                                                                                                  Qt.SmoothTransformation)
-            ]
+            self.bird.set_size(int(new_width), int(new_height))
             self.pipes.clear()
             self.bird.lift = self.original_lift * 1.1
             self.bird.gravity = self.original_gravity * 0.9
@@ -966,12 +2488,14 @@ class GameWindow(QMainWindow):
 
         elif event_name == "Cloudy Sky":
             self.is_cloudy_sky_event = True
-            self.cloud_spawn_timer.start(random.randint(self.CLOUD_SPAWN_INTERVAL_MIN, self.CLOUD_SPAWN_INTERVAL_MAX))
+            self.scheduler.schedule(
+                "cloud_spawn", self.rng.randint(self.CLOUD_SPAWN_INTERVAL_MIN, self.CLOUD_SPAWN_INTERVAL_MAX) / 1000,
+                self.spawn_cloud, repeat=True)
             self.background_clouds = []
             self.foreground_clouds = []
 
     def end_random_event(self):
-        pygame.mixer.Sound(AUDIO_SWOOSH).play()
+        sound_bank.play(AUDIO_SWOOSH)
 
         if self.current_event == "Moon Gravity":
             self.gravity_target = GRAVITY
@@ -979,18 +2503,7 @@ class GameWindow(QMainWindow):
             self.PIPE_GAP_HEIGHT = self.original_pipe_gap_height
 
         elif self.current_event == "Size Changer":
-            self.bird.width, self.bird.height = self.original_bird_size
-            self.bird.sprite_frames = [
-                QPixmap(os.path.join(SPRITES_PATH, f"{self.bird.color}bird-upflap.png")).scaled(*BIRD_ASSET_SIZE,
-                                                                                                Qt.KeepAspectRatio,
-                                                                                                Qt.SmoothTransformation),
-                QPixmap(os.path.join(SPRITES_PATH, f"{self.bird.color}bird-midflap.png")).scaled(*BIRD_ASSET_SIZE,
-                                                                                                 Qt.KeepAspectRatio,
-                                                                                                 Qt.SmoothTransformation),
-                QPixmap(os.path.join(SPRITES_PATH, f"{self.bird.color}bird-downflap.png")).scaled(*BIRD_ASSET_SIZE,
-                                                                                                  Qt.KeepAspectRatio,
-                                                                                                  Qt.SmoothTransformation)
-            ]
+            self.bird.set_size(*self.original_bird_size)
             self.bird.lift = self.original_lift
             self.bird.gravity = self.original_gravity
             self.PIPE_GAP_HEIGHT = self.original_pipe_gap_height
@@ -1000,13 +2513,13 @@ class GameWindow(QMainWindow):
 
         elif self.current_event == "Cloudy Sky":
             self.is_cloudy_sky_event = False
-            self.cloud_spawn_timer.stop()
+            self.scheduler.cancel("cloud_spawn")
             self.background_clouds = []
             self.foreground_clouds = []
 
         self.current_event = None
-        self.last_event_end_time = time.time()
-        self.next_event_time = time.time() + random.uniform(self.EVENT_INTERVAL_MIN, self.EVENT_INTERVAL_MAX)
+        self.scheduler.cancel("event_end")
+        self.schedule_next_event()
 
     def update_pipes(self):
         pipes_to_remove = []
@@ -1017,48 +2530,56 @@ class GameWindow(QMainWindow):
 
             if not pipe.passed and pipe.x < self.bird.x:
                 pipe.passed = True
+                telemetry.count(METRIC_PIPES_PASSED)
                 if pipe.is_special:
                     self.score += 5 * self.score_multiplier
                 else:
                     self.score += 1 * self.score_multiplier
-                pygame.mixer.Sound(AUDIO_POINT).play()
+                sound_bank.play(AUDIO_POINT)
 
         for pipe in pipes_to_remove:
             self.pipes.remove(pipe)
 
     def check_collisions(self):
-        if self.bird.get_hitbox().intersects(self.ground.get_hitbox()):
-            self.game_over(hit=True)
+        bird_hitbox = self.bird.get_hitbox()
+        if bird_hitbox.intersects(self.ground.get_hitbox()):
+            self.game_over(hit=True, cause="ground")
             return
 
         if self.bird.y <= 0 and self.bird.gravity == GRAVITY:
-            self.game_over(hit=False)
+            self.game_over(hit=False, cause="ceiling")
             return
 
         for pipe in self.pipes:
-            if self.bird.get_hitbox().intersects(pipe.get_top_hitbox()) or \
-                    self.bird.get_hitbox().intersects(pipe.get_bottom_hitbox(WINDOW_HEIGHT)):
-                self.game_over(hit=True)
+            if bird_hitbox.intersects(pipe.get_top_hitbox()) or \
+                    bird_hitbox.intersects(pipe.get_bottom_hitbox(WINDOW_HEIGHT)):
+                self.game_over(hit=True, cause="pipe")
                 return
 
-    def game_over(self, hit=False):
+    def game_over(self, hit=False, cause=None):
+        self.death_cause = cause
+        if cause in DEATH_CAUSES:
+            telemetry.count(METRIC_DEATHS + DEATH_CAUSES.index(cause))
         if hit:
-            pygame.mixer.Sound(AUDIO_HIT).play()
-        pygame.mixer.Sound(AUDIO_DIE).play()
+            sound_bank.play(AUDIO_HIT)
+        sound_bank.play(AUDIO_DIE)
         self.game_state = GameState.GAME_OVER
-        self.pipe_spawn_timer.stop()
-        self.cloud_spawn_timer.stop()
-        self.update()
+        self.stop_ghost(self.score)
+        self.request_repaint()
         self.end_random_event()
-        self.game_over_timer.start(2000)
+        self.cancel_play_schedule()
+        self.frame_budget.safe_point()
+        self.run_on_gui(self.game_over_timer.start, 2000)
 
     def restart_game(self):
         self.game_state = GameState.MAIN_MENU
+        self.rewind_position = None
         self.score = 0
-        self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.skins[self.current_skin_index])
+        self.bird = Bird(self.BIRD_START_X, self.BIRD_START_Y, self.skins[self.current_skin_index], self.rng)
         self.pipes = []
-        self.pipe_spawn_timer.stop()
-        self.cloud_spawn_timer.stop()
+        self.input_queue.clear()
+        self.stop_ghost()
+        self.cancel_play_schedule()
         self.background_clouds = []
         self.foreground_clouds = []
         self.is_cloudy_sky_event = False
@@ -1067,11 +2588,16 @@ class GameWindow(QMainWindow):
         self.PIPE_GAP_HEIGHT = self.original_pipe_gap_height
         self.score_multiplier = 1
         self.gravity_target = GRAVITY
-        self.message_image = QPixmap(MESSAGE_PATH).scaledToWidth(int(WINDOW_WIDTH * 0.8))
+        self.clock.paused = False
+        self.message_image = asset_cache.pixmap(MESSAGE_PATH, int(WINDOW_WIDTH * 0.8))
         self.event_timer_active = False
+        self.frame_budget.safe_point()
 
 
 def main():
+    # Window and painter sizes in device-independent pixels; AssetCache supplies the extra resolution
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app = QApplication(sys.argv)
     window = GameWindow()
     window.show()
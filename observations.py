@@ -0,0 +1,128 @@
+import argparse
+import time
+
+import numpy as np
+from PyQt5 import sip
+from PyQt5.QtGui import QImage, QPainter
+
+from headless import create_app, Autopilot, HeadlessRunner
+from main import WINDOW_WIDTH, WINDOW_HEIGHT, GameWindow, GameState
+
+# --- Pixel Observations ---
+# Renders the scene with the window's own render_scene() straight into NumPy memory. The frame stack is
+# one preallocated array of 2 * stack slots, each wrapped by a QImage painting into it in place. A frame is
+# painted into slot i and mirrored into slot i + stack, so the newest `stack` frames are always the
+# contiguous slice [i + 1, i + 1 + stack): observations are views, never assembled per frame. The mirror costs
+# one frame-sized memcpy per observation; a view can't wrap around a ring, and painting twice costs far more.
+MODES = {"adventure": GameState.ADVENTURE_MODE, "pipe_control": GameState.PIPE_CONTROL_MODE}
+DEFAULT_RESOLUTIONS = "84x84,100x150,200x300,400x600"
+
+
+def parse_resolution(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+class PixelObserver:
+    def __init__(self, window, width=84, height=84, grayscale=True, stack=4, background=True, clouds=True,
+                 hud=True, debug=False):
+        self.window = window
+        self.width = width
+        self.height = height
+        self.stack = stack
+        self.layers = {"background": background, "clouds": clouds, "hud": hud}
+        self.debug = debug
+        channels = 1 if grayscale else 3
+        image_format = QImage.Format_Grayscale8 if grayscale else QImage.Format_RGB888
+        # QImage scanlines must start on 4-byte boundaries
+        stride = (width * channels + 3) // 4 * 4
+        slots = stack * 2 if stack > 1 else 1
+        self.buffer = np.zeros((slots, height, stride), dtype=np.uint8)
+        self.images = [QImage(sip.voidptr(self.buffer[slot].ctypes.data), width, height, stride, image_format)
+                       for slot in range(stack)]
+        pixels = self.buffer[:, :, :width * channels]
+        self.frames = pixels if grayscale else pixels.reshape(slots, height, width, 3)
+        self.head = stack - 1
+        self.rendered = 0
+
+    def render_into(self, slot):
+        # Scaled sprites only partly cover edge pixels, so the slot's previous frame must not show through
+        self.images[slot].fill(0)
+        painter = QPainter(self.images[slot])
+        painter.scale(self.width / WINDOW_WIDTH, self.height / WINDOW_HEIGHT)
+        # The window's debug mode is on by default; agents shouldn't see hitboxes and debug text
+        debug_mode = self.window.debug_mode
+        self.window.debug_mode = self.debug
+        self.window.render_scene(painter, **self.layers)
+        self.window.debug_mode = debug_mode
+        painter.end()
+        self.rendered += 1
+
+    def observe(self):
+        # Paints the current state over the oldest frame and returns the stack, oldest first
+        self.head = (self.head + 1) % self.stack
+        self.render_into(self.head)
+        if self.stack > 1:
+            self.buffer[self.head + self.stack] = self.buffer[self.head]
+        return self.observation()
+
+    def reset(self):
+        # A fresh episode starts with the stack filled with its first frame
+        self.head = self.stack - 1
+        self.render_into(self.head)
+        self.buffer[:] = self.buffer[self.head]
+        return self.observation()
+
+    def observation(self):
+        return self.frames[self.head + 1:self.head + 1 + self.stack] if self.stack > 1 else self.frames
+
+    def latest(self):
+        return self.frames[self.head]
+
+
+def benchmark(args):
+    app = create_app()
+    window = GameWindow()
+    runner = HeadlessRunner(window, MODES[args.mode], Autopilot())
+    for _ in range(args.warmup):
+        runner.step()
+
+    color_modes = [True, False] if args.color == "both" else [args.color == "gray"]
+    layers = {"background": not args.no_background, "clouds": not args.no_clouds, "hud": not args.no_hud}
+    skipped = [name for name, enabled in layers.items() if not enabled]
+    print(f"{args.frames} observations per row, stack {args.stack}, "
+          f"{'without ' + ', '.join(skipped) if skipped else 'all layers'}{', debug overlay' if args.debug else ''}")
+    for width, height in map(parse_resolution, args.resolutions.split(",")):
+        for grayscale in color_modes:
+            observer = PixelObserver(window, width, height, grayscale, args.stack, debug=args.debug, **layers)
+            observation = observer.reset()
+            render_time = 0.0
+            start_time = time.perf_counter()
+            for _ in range(args.frames):
+                runner.step()
+                render_start = time.perf_counter()
+                observation = observer.observe()
+                render_time += time.perf_counter() - render_start
+            elapsed = time.perf_counter() - start_time
+            if not np.shares_memory(observation, observer.buffer):
+                print("Warning: observation is a copy, not a view of the frame stack")
+            print(f"{width:4d}x{height:<4d} {'gray' if grayscale else 'rgb ':4s}  "
+                  f"{args.frames / render_time:8.0f} obs/s rendering only  "
+                  f"{args.frames / elapsed:8.0f} obs/s with simulation  "
+                  f"{observer.buffer.nbytes / 1024:8.1f} KiB stack")
+    app.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pixel observations rendered into NumPy frame stacks.")
+    parser.add_argument("--resolutions", default=DEFAULT_RESOLUTIONS, help="Comma-separated WIDTHxHEIGHT list")
+    parser.add_argument("--color", choices=["gray", "rgb", "both"], default="both")
+    parser.add_argument("--stack", type=int, default=4, help="Frames per observation")
+    parser.add_argument("--frames", type=int, default=1000, help="Observations per resolution")
+    parser.add_argument("--warmup", type=int, default=120, help="Ticks simulated before measuring")
+    parser.add_argument("--mode", choices=MODES, default="adventure")
+    parser.add_argument("--no-background", action="store_true", help="Clear to black instead of the sky")
+    parser.add_argument("--no-clouds", action="store_true")
+    parser.add_argument("--no-hud", action="store_true", help="Skip score, menus, event bar and HUD text")
+    parser.add_argument("--debug", action="store_true", help="Keep the debug overlay")
+    benchmark(parser.parse_args())
@@ -0,0 +1,230 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QImage, QPainter, QPixmap
+from PyQt5.QtWidgets import QApplication, QInputDialog
+
+import main
+from main import GameWindow, GameState, Bird, Pipe, Cloud, asset_cache
+from headless import create_app, Autopilot, HeadlessRunner
+
+# --- Soak / Stress Test ---
+# Drives the full cabinet cycle (start_game -> game_over -> name dialog -> restart_game) thousands of
+# times with the scripted autopilot, mixing in stress cycles, and samples memory as it goes. Growth is
+# measured from a baseline taken after the warm-up cycles, once caches have filled.
+MODES = {"adventure": GameState.ADVENTURE_MODE, "pipe_control": GameState.PIPE_CONTROL_MODE}
+STRESS_CYCLES = {
+    # Cloudy Sky for the whole cycle with a cloud every tick
+    "clouds": {"CLOUD_SPAWN_INTERVAL_MIN": 16, "CLOUD_SPAWN_INTERVAL_MAX": 16,
+               "EVENT_DURATION_MIN": 3600.0, "EVENT_DURATION_MAX": 3600.0},
+    # Events starting and ending back to back
+    "events": {"EVENT_INTERVAL_MIN": 0.05, "EVENT_INTERVAL_MAX": 0.1,
+               "EVENT_DURATION_MIN": 0.2, "EVENT_DURATION_MAX": 0.5},
+    # A pipe (or two moving ones) every tick, a couple of hundred on screen at once
+    "pipes": {"PIPE_SPAWN_INTERVAL": 16},
+}
+TRACKED_TYPES = {"QPixmap": QPixmap, "Bird": Bird, "Pipe": Pipe, "Cloud": Cloud}
+TOP_GROWTH_SITES = 10
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # Not Linux: only the peak is available, in KiB (bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def live_objects():
+    counts = dict.fromkeys(TRACKED_TYPES, 0)
+    for obj in gc.get_objects():
+        for name, cls in TRACKED_TYPES.items():
+            if isinstance(obj, cls):
+                counts[name] += 1
+    return counts
+
+
+def asset_cache_bytes():
+    return sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8 for pixmap in asset_cache.pixmaps.values())
+
+
+def answer_name_dialog():
+    dialog = QApplication.activeModalWidget()
+    if isinstance(dialog, QInputDialog):
+        dialog.setTextValue("SOAK")
+        dialog.accept()
+
+
+class SoakTest:
+    def __init__(self, args):
+        self.args = args
+        self.window = GameWindow()
+        self.runner = HeadlessRunner(self.window, MODES[args.mode], Autopilot(flap_margin=12))
+        self.dialog_timer = QTimer()
+        self.dialog_timer.setSingleShot(True)
+        self.dialog_timer.timeout.connect(answer_name_dialog)
+        self.frame = None
+        if args.render:
+            self.frame = QImage(main.WINDOW_WIDTH, main.WINDOW_HEIGHT, QImage.Format_RGB32)
+        self.cycles = 0
+        self.ticks = 0
+        self.samples = []
+        self.baseline_snapshot = None
+
+    def stress_kind(self):
+        if not self.args.stress_every or self.cycles % self.args.stress_every:
+            return None
+        kinds = list(STRESS_CYCLES)
+        return kinds[(self.cycles // self.args.stress_every) % len(kinds)]
+
+    def run_cycle(self):
+        window = self.window
+        kind = self.stress_kind()
+        overrides = STRESS_CYCLES.get(kind, {})
+        # Instance attributes shadow the GameWindow constants for this cycle only
+        for name, value in overrides.items():
+            setattr(window, name, value)
+
+        self.runner.start()
+        if kind == "clouds":
+            window.trigger_event("Cloudy Sky")
+        for _ in range(self.args.max_ticks):
+            self.runner.step()
+            self.ticks += 1
+            if self.frame is not None:
+                self.render()
+            if window.game_state == GameState.GAME_OVER:
+                break
+        if window.game_state != GameState.GAME_OVER:
+            window.game_over()
+        window.game_over_timer.stop()
+
+        for name in overrides:
+            delattr(window, name)
+
+        # Keep every cycle on the name-entry path; the dialog is answered from inside its own event loop
+        window.leaderboard.clear()
+        self.dialog_timer.start(0)
+        window.show_name_input_dialog()
+        self.dialog_timer.stop()
+        QApplication.processEvents()
+        self.cycles += 1
+
+    def render(self):
+        painter = QPainter(self.frame)
+        self.window.render_scene(painter)
+        painter.end()
+
+    def sample(self):
+        gc.collect()
+        sample = {
+            "cycle": self.cycles,
+            "ticks": self.ticks,
+            "rss": rss_bytes(),
+            "heap": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+            "asset_cache_pixmaps": len(asset_cache.pixmaps),
+            "asset_cache_bytes": asset_cache_bytes(),
+        }
+        sample.update(live_objects())
+        self.samples.append(sample)
+        print(f"cycle {sample['cycle']:6d}  ticks {sample['ticks']:9d}  rss {sample['rss'] / 2 ** 20:8.1f} MiB  "
+              f"heap {sample['heap'] / 2 ** 20:7.2f} MiB  asset cache {sample['asset_cache_pixmaps']:4d} "
+              f"({sample['asset_cache_bytes'] / 2 ** 20:.1f} MiB)  "
+              + "  ".join(f"{name} {sample[name]}" for name in TRACKED_TYPES), flush=True)
+        return sample
+
+    def run(self):
+        args = self.args
+        start_time = time.perf_counter()
+        for _ in range(args.warmup):
+            self.run_cycle()
+
+        tracemalloc.start(args.trace_depth)
+        baseline = self.sample()
+        self.baseline_snapshot = tracemalloc.take_snapshot()
+        while self.cycles < args.warmup + args.cycles:
+            self.run_cycle()
+            if (self.cycles - args.warmup) % args.sample_every == 0:
+                self.sample()
+        if self.samples[-1]["cycle"] != self.cycles:
+            self.sample()
+        final = self.samples[-1]
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        elapsed = time.perf_counter() - start_time
+        print(f"{self.cycles} cycles, {self.ticks} ticks in {elapsed:.1f} s")
+        print("Largest heap growth since baseline:")
+        for stat in snapshot.compare_to(self.baseline_snapshot, "traceback")[:TOP_GROWTH_SITES]:
+            frame = stat.traceback[-1]
+            print(f"    {stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks  {frame.filename}:{frame.lineno}")
+        return self.check(baseline, final)
+
+    def check(self, baseline, final):
+        args = self.args
+        limits = [
+            ("rss", args.max_rss_growth * 2 ** 20, "MiB", 2 ** 20),
+            ("heap", args.max_heap_growth * 2 ** 20, "MiB", 2 ** 20),
+            ("asset_cache_bytes", args.max_asset_cache_growth * 2 ** 20, "MiB", 2 ** 20),
+            ("QPixmap", args.max_object_growth, "objects", 1),
+            ("Bird", args.max_object_growth, "objects", 1),
+            ("Pipe", args.max_object_growth, "objects", 1),
+            ("Cloud", args.max_object_growth, "objects", 1),
+        ]
+        failures = []
+        for name, limit, unit, divisor in limits:
+            growth = final[name] - baseline[name]
+            if growth > limit:
+                failures.append(f"{name} grew by {growth / divisor:.2f} {unit} (limit {limit / divisor:g} {unit})")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if not failures:
+            print("PASS: no growth above the thresholds")
+        return not failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak and stress test: thousands of automated game cycles "
+                                                 "with memory growth checks.")
+    parser.add_argument("--cycles", type=int, default=2000, help="Measured cycles after the warm-up")
+    parser.add_argument("--warmup", type=int, default=30, help="Cycles run before the baseline sample")
+    parser.add_argument("--max-ticks", type=int, default=3000, help="Ticks before a cycle is ended by force")
+    parser.add_argument("--stress-every", type=int, default=5,
+                        help="Every Nth cycle is a stress cycle (0 disables them)")
+    parser.add_argument("--sample-every", type=int, default=100, help="Cycles between memory samples")
+    parser.add_argument("--mode", choices=MODES, default="adventure")
+    parser.add_argument("--render", action="store_true", help="Also render every tick offscreen")
+    parser.add_argument("--trace-depth", type=int, default=5, help="tracemalloc traceback depth")
+    parser.add_argument("--max-rss-growth", type=float, default=32.0, metavar="MIB")
+    parser.add_argument("--max-heap-growth", type=float, default=4.0, metavar="MIB")
+    parser.add_argument("--max-asset-cache-growth", type=float, default=1.0, metavar="MIB")
+    parser.add_argument("--max-object-growth", type=int, default=50, help="Allowed growth in live QPixmap, "
+                                                                          "Bird, Pipe and Cloud objects")
+    parser.add_argument("--output", metavar="FILE", help="Write the samples and verdict as JSON")
+    args = parser.parse_args()
+
+    app = create_app()
+    # Scores from automated cycles must not end up on the cabinet's real leaderboard
+    scratch = tempfile.TemporaryDirectory()
+    main.LEADERBOARD_FILE = os.path.join(scratch.name, "leaderboard.json")
+
+    soak = SoakTest(args)
+    passed = soak.run()
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"passed": passed, "samples": soak.samples}, f, indent=4)
+    sys.exit(0 if passed else 1)
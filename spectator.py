@@ -0,0 +1,311 @@
+import socket
+import struct
+import time
+import weakref
+from collections import deque
+
+from telemetry import percentile
+
+# --- Spectator Snapshot Codec ---
+# Every tick the renderable game state is quantized to small integers and sent as one UDP datagram.
+# Keyframes carry everything; deltas only carry fields that changed since the previous tick, so a
+# viewer that misses a datagram waits for the next keyframe.
+KEYFRAME_INTERVAL = 60  # ticks between full snapshots
+ENCODE_TIME_SAMPLES = 512
+MAX_DATAGRAM_SIZE = 65507
+
+KEYFRAME = ord("K")
+DELTA = ord("D")
+
+# (name, struct format, scale) -- values are sent as round(value * scale)
+SCALAR_FIELDS = [
+    ("game_state", "B", 1),
+    ("bird_x", "h", 4),
+    ("bird_y", "h", 4),
+    ("bird_rotation", "h", 10),
+    ("bird_frame", "B", 1),
+    ("bird_width", "B", 1),
+    ("bird_height", "B", 1),
+    ("bird_color", "B", 1),
+    ("score", "I", 1),
+    ("event", "B", 1),  # index into the event list + 1, 0 for no event
+    ("background_fade", "H", 1000),
+    ("background_is_day", "B", 1),
+    ("background_scroll_x", "h", 4),
+    ("ground_x1", "h", 4),
+    ("ground_x2", "h", 4),
+    ("is_cloudy_sky", "B", 1),
+]
+PIPE_FIELDS = [
+    ("x", "h", 4),
+    ("gap_y", "h", 4),
+    ("gap_height", "H", 1),
+    ("flags", "B", 1),  # bit 0: special, bit 1: moving
+]
+CLOUD_FIELDS = [
+    ("x", "h", 4),
+    ("y", "h", 4),
+    ("opacity", "B", 255),
+    ("layer", "B", 1),  # 0: background, 1: foreground
+    ("size_factor", "H", 100),
+]
+TABLES = [PIPE_FIELDS, CLOUD_FIELDS]
+
+FORMAT_RANGES = {"B": (0, 0xFF), "H": (0, 0xFFFF), "h": (-0x8000, 0x7FFF), "I": (0, 0xFFFFFFFF)}
+HEADER = struct.Struct("<BII")  # kind, tick, base tick
+MASK = struct.Struct("<I")
+COUNT = struct.Struct("<H")
+ENTITY_ID = struct.Struct("<I")
+ENTITY_DELTA = struct.Struct("<IB")  # id, changed field mask
+
+
+def fields_struct(fields):
+    return struct.Struct("<" + "".join(fmt for _, fmt, _ in fields))
+
+
+def quantize(fields, values):
+    quantized = []
+    for (_, fmt, scale), value in zip(fields, values):
+        low, high = FORMAT_RANGES[fmt]
+        quantized.append(max(low, min(high, int(round(value * scale)))))
+    return tuple(quantized)
+
+
+def dequantize(fields, values):
+    return {name: value / scale for (name, _, scale), value in zip(fields, values)}
+
+
+class SnapshotEncoder:
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self.scalar_struct = fields_struct(SCALAR_FIELDS)
+        self.scalar_field_structs = [struct.Struct("<" + fmt) for _, fmt, _ in SCALAR_FIELDS]
+        self.entity_structs = [fields_struct(fields) for fields in TABLES]
+        self.entity_field_structs = [[struct.Struct("<" + fmt) for _, fmt, _ in fields] for fields in TABLES]
+        self.tick = 0
+        self.last_keyframe_tick = 0
+        self.previous = None
+
+    def encode(self, scalars, tables, force_keyframe=False):
+        self.tick += 1
+        if force_keyframe or self.previous is None or self.tick - self.last_keyframe_tick >= self.keyframe_interval:
+            data = self.encode_keyframe(scalars, tables)
+            self.last_keyframe_tick = self.tick
+        else:
+            data = self.encode_delta(scalars, tables)
+        self.previous = (scalars, tables)
+        return data
+
+    def encode_keyframe(self, scalars, tables):
+        parts = [HEADER.pack(KEYFRAME, self.tick, 0), self.scalar_struct.pack(*scalars)]
+        for entity_struct, table in zip(self.entity_structs, tables):
+            parts.append(COUNT.pack(len(table)))
+            for entity_id, values in table.items():
+                parts.append(ENTITY_ID.pack(entity_id))
+                parts.append(entity_struct.pack(*values))
+        return b"".join(parts)
+
+    def encode_delta(self, scalars, tables):
+        previous_scalars, previous_tables = self.previous
+        mask = 0
+        changed = []
+        for index, (value, previous_value) in enumerate(zip(scalars, previous_scalars)):
+            if value != previous_value:
+                mask |= 1 << index
+                changed.append(self.scalar_field_structs[index].pack(value))
+        parts = [HEADER.pack(DELTA, self.tick, self.tick - 1), MASK.pack(mask)] + changed
+
+        for field_structs, table, previous_table in zip(self.entity_field_structs, tables, previous_tables):
+            removed = [entity_id for entity_id in previous_table if entity_id not in table]
+            parts.append(COUNT.pack(len(removed)))
+            parts.append(struct.pack(f"<{len(removed)}I", *removed))
+
+            updates = []
+            for entity_id, values in table.items():
+                previous_values = previous_table.get(entity_id)
+                if values == previous_values:
+                    continue
+                entity_mask = 0
+                entity_fields = []
+                for index, value in enumerate(values):
+                    if previous_values is None or value != previous_values[index]:
+                        entity_mask |= 1 << index
+                        entity_fields.append(field_structs[index].pack(value))
+                updates.append(ENTITY_DELTA.pack(entity_id, entity_mask) + b"".join(entity_fields))
+            parts.append(COUNT.pack(len(updates)))
+            parts.extend(updates)
+        return b"".join(parts)
+
+
+class SnapshotDecoder:
+    def __init__(self):
+        self.scalar_struct = fields_struct(SCALAR_FIELDS)
+        self.scalar_field_structs = [struct.Struct("<" + fmt) for _, fmt, _ in SCALAR_FIELDS]
+        self.entity_structs = [struct.Struct("<I" + fields_struct(fields).format[1:]) for fields in TABLES]
+        self.entity_field_structs = [[struct.Struct("<" + fmt) for _, fmt, _ in fields] for fields in TABLES]
+        self.tick = None
+        self.scalars = None
+        self.tables = [{} for _ in TABLES]
+
+    def decode(self, data):
+        kind, tick, base_tick = HEADER.unpack_from(data, 0)
+        offset = HEADER.size
+        if kind == KEYFRAME:
+            scalars = self.scalar_struct.unpack_from(data, offset)
+            offset += self.scalar_struct.size
+            tables = []
+            for entity_struct in self.entity_structs:
+                (count,) = COUNT.unpack_from(data, offset)
+                offset += COUNT.size
+                table = {}
+                for _ in range(count):
+                    entity_id, *values = entity_struct.unpack_from(data, offset)
+                    offset += entity_struct.size
+                    table[entity_id] = tuple(values)
+                tables.append(table)
+        elif kind == DELTA:
+            # Deltas only apply on top of the exact tick they were encoded against
+            if self.tick is None or base_tick != self.tick:
+                return False
+            (mask,) = MASK.unpack_from(data, offset)
+            offset += MASK.size
+            scalars = list(self.scalars)
+            for index, field_struct in enumerate(self.scalar_field_structs):
+                if mask & (1 << index):
+                    (scalars[index],) = field_struct.unpack_from(data, offset)
+                    offset += field_struct.size
+
+            tables = []
+            for field_structs, previous_table in zip(self.entity_field_structs, self.tables):
+                table = dict(previous_table)
+                (removed_count,) = COUNT.unpack_from(data, offset)
+                offset += COUNT.size
+                for entity_id in struct.unpack_from(f"<{removed_count}I", data, offset):
+                    table.pop(entity_id, None)
+                offset += 4 * removed_count
+
+                (update_count,) = COUNT.unpack_from(data, offset)
+                offset += COUNT.size
+                for _ in range(update_count):
+                    entity_id, entity_mask = ENTITY_DELTA.unpack_from(data, offset)
+                    offset += ENTITY_DELTA.size
+                    values = list(table.get(entity_id, (0,) * len(field_structs)))
+                    for index, field_struct in enumerate(field_structs):
+                        if entity_mask & (1 << index):
+                            (values[index],) = field_struct.unpack_from(data, offset)
+                            offset += field_struct.size
+                    table[entity_id] = tuple(values)
+                tables.append(table)
+        else:
+            return False
+
+        self.tick = tick
+        self.scalars = tuple(scalars)
+        self.tables = tables
+        return True
+
+    def state(self):
+        return dequantize(SCALAR_FIELDS, self.scalars)
+
+    def entities(self, table_index):
+        fields = TABLES[table_index]
+        return {entity_id: dequantize(fields, values) for entity_id, values in self.tables[table_index].items()}
+
+
+def parse_address(address):
+    host, _, port = address.strip().rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+# --- Spectator Broadcaster ---
+class SpectatorBroadcaster:
+    def __init__(self, targets, event_names, keyframe_interval=KEYFRAME_INTERVAL):
+        self.targets = [parse_address(target) for target in targets.split(",") if target.strip()]
+        self.event_names = event_names
+        self.encoder = SnapshotEncoder(keyframe_interval)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+
+        # Pipes and clouds have no ids of their own; hand them out on first sight
+        self.entity_ids = weakref.WeakKeyDictionary()
+        self.next_entity_id = 1
+
+        self.ticks = 0
+        self.keyframes = 0
+        self.bytes_sent = 0
+        self.dropped = 0
+        self.encode_times = deque(maxlen=ENCODE_TIME_SAMPLES)
+        self.start_time = None
+
+    def entity_id(self, entity):
+        entity_id = self.entity_ids.get(entity)
+        if entity_id is None:
+            entity_id = self.next_entity_id
+            self.next_entity_id += 1
+            self.entity_ids[entity] = entity_id
+        return entity_id
+
+    def capture(self, window):
+        bird = window.bird
+        event = self.event_names.index(window.current_event) + 1 if window.current_event else 0
+        scalars = quantize(SCALAR_FIELDS, (
+            window.game_state.value,
+            bird.x,
+            bird.y,
+            bird.rotation,
+            bird.frame,
+            bird.width,
+            bird.height,
+            window.skins.index(bird.color),
+            window.score,
+            event,
+            window.background_fade_factor(),
+            window.current_background_texture is window.background_day_texture,
+            window.background_scroll_x,
+            window.ground.x1,
+            window.ground.x2,
+            window.is_cloudy_sky_event,
+        ))
+        pipes = {
+            self.entity_id(pipe): quantize(PIPE_FIELDS, (
+                pipe.x, pipe.gap_y, pipe.gap_height, pipe.is_special | (pipe.is_moving << 1)))
+            for pipe in window.pipes
+        }
+        clouds = {}
+        for layer, layer_clouds in enumerate([window.background_clouds, window.foreground_clouds]):
+            for cloud in layer_clouds:
+                clouds[self.entity_id(cloud)] = quantize(CLOUD_FIELDS, (
+                    cloud.x, cloud.y, cloud.opacity, layer, cloud.size_factor))
+        return scalars, [pipes, clouds]
+
+    def publish(self, window):
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        start = time.perf_counter()
+        scalars, tables = self.capture(window)
+        data = self.encoder.encode(scalars, tables)
+        self.encode_times.append(time.perf_counter() - start)
+        self.ticks += 1
+
+        if data[0] == KEYFRAME:
+            self.keyframes += 1
+        if len(data) > MAX_DATAGRAM_SIZE:
+            self.dropped += 1
+            return
+        for target in self.targets:
+            try:
+                self.socket.sendto(data, target)
+                self.bytes_sent += len(data)
+            except OSError:
+                # Nobody listening or the send buffer is full; the next keyframe resyncs the viewer
+                self.dropped += 1
+
+    def report(self):
+        if not self.ticks:
+            return "no ticks published"
+        elapsed = max(1e-9, time.perf_counter() - self.start_time)
+        bytes_per_tick = self.bytes_sent / self.ticks / max(1, len(self.targets))
+        return (f"{bytes_per_tick:.0f} B/tick, {self.bytes_sent / elapsed / 1024:.1f} KiB/s, "
+                f"encode p50 {percentile(self.encode_times, 50) * 1e6:.0f} us / "
+                f"p99 {percentile(self.encode_times, 99) * 1e6:.0f} us, "
+                f"{self.keyframes} keyframes, {self.dropped} dropped")
@@ -0,0 +1,205 @@
+import argparse
+import os
+import socket
+import struct
+import sys
+
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtGui import QColor, QPainter, QPixmap
+from PyQt5.QtCore import Qt, QTimer
+
+from main import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, GROUND_HEIGHT, BIRD_ASSET_SIZE, BIRD_SKINS, RANDOM_EVENTS, SPRITES_PATH,
+    BACKGROUND_DAY, BACKGROUND_NIGHT, GAME_OVER_PATH, MESSAGE_PATH, CLOUDS_BG_PATH, CLOUDS_FG_PATH,
+    SCREEN_DARKENING_OPACITY, SCREEN_DARKENING_COLOR_R, SCREEN_DARKENING_COLOR_G, SCREEN_DARKENING_COLOR_B,
+    GROUND_DARKENING_OPACITY, GameState, Bird, Pipe, Ground, Cloud,
+)
+from spectator import SnapshotDecoder, MAX_DATAGRAM_SIZE, parse_address
+
+
+# --- Spectator Viewer ---
+# Renders snapshots from SpectatorBroadcaster with the game's own Bird/Pipe/Ground/Cloud drawing code.
+class SpectatorViewer(QWidget):
+    def __init__(self, address):
+        super().__init__()
+        self.setWindowTitle("Flappy Bird: EXTENDED - Spectator")
+        self.setFixedSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(parse_address(address))
+        self.socket.setblocking(False)
+        self.decoder = SnapshotDecoder()
+        self.state = None
+
+        self.background_day_texture = QPixmap(BACKGROUND_DAY).scaled(WINDOW_WIDTH + 1, WINDOW_HEIGHT + 1,
+                                                                     Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self.background_night_texture = QPixmap(BACKGROUND_NIGHT).scaled(WINDOW_WIDTH + 1, WINDOW_HEIGHT + 1,
+                                                                         Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self.game_over_image = QPixmap(GAME_OVER_PATH).scaledToWidth(int(WINDOW_WIDTH * 0.8))
+        self.message_image = QPixmap(MESSAGE_PATH).scaledToWidth(int(WINDOW_WIDTH * 0.8))
+        self.number_sprites = [QPixmap(os.path.join(SPRITES_PATH, f"{i}.png")) for i in range(10)]
+
+        self.ground = Ground()
+        self.birds = {}
+        self.pipes = {}
+        self.clouds = {}
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.poll)
+        self.poll_timer.start(16)
+
+    def poll(self):
+        received = False
+        while True:
+            try:
+                data = self.socket.recv(MAX_DATAGRAM_SIZE)
+            except BlockingIOError:
+                break
+            try:
+                received |= self.decoder.decode(data)
+            except struct.error as e:
+                print(f"Error decoding snapshot: {e}")
+        if received:
+            self.sync()
+            self.update()
+
+    def get_bird(self, color, width, height):
+        key = (color, width, height)
+        if key not in self.birds:
+            bird = Bird(0, 0, color)
+            if (width, height) != BIRD_ASSET_SIZE:
+                bird.set_size(width, height)
+            self.birds[key] = bird
+        return self.birds[key]
+
+    def sync(self):
+        self.state = self.decoder.state()
+        self.ground.x1 = self.state["ground_x1"]
+        self.ground.x2 = self.state["ground_x2"]
+
+        pipes = self.decoder.entities(0)
+        for entity_id in list(self.pipes):
+            if entity_id not in pipes:
+                del self.pipes[entity_id]
+        for entity_id, values in pipes.items():
+            pipe = self.pipes.get(entity_id)
+            if pipe is None:
+                pipe = Pipe(values["x"], values["gap_y"], values["gap_height"],
+                            is_special=bool(int(values["flags"]) & 1))
+                self.pipes[entity_id] = pipe
+            pipe.x = values["x"]
+            pipe.gap_y = values["gap_y"]
+            pipe.gap_height = values["gap_height"]
+
+        clouds = self.decoder.entities(1)
+        for entity_id in list(self.clouds):
+            if entity_id not in clouds:
+                del self.clouds[entity_id]
+        for entity_id, values in clouds.items():
+            cloud = self.clouds.get(entity_id)
+            if cloud is None:
+                sprite_path = CLOUDS_FG_PATH if values["layer"] else CLOUDS_BG_PATH
+                cloud = Cloud(values["x"], values["y"], 0, values["opacity"], values["size_factor"], sprite_path)
+                self.clouds[entity_id] = cloud
+            cloud.x = values["x"]
+            cloud.y = values["y"]
+            cloud.opacity = values["opacity"]
+            cloud.layer = values["layer"]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        if self.state is None:
+            painter.fillRect(self.rect(), Qt.black)
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(self.rect(), Qt.AlignCenter, "Waiting for keyframe...")
+            return
+        state = self.state
+
+        if state["background_is_day"]:
+            fading_in_texture, fading_out_texture = self.background_day_texture, self.background_night_texture
+        else:
+            fading_in_texture, fading_out_texture = self.background_night_texture, self.background_day_texture
+        fade_factor = state["background_fade"]
+        scroll_x = int(state["background_scroll_x"])
+        painter.save()
+        painter.setOpacity(1.0 - fade_factor)
+        painter.drawPixmap(scroll_x, 0, fading_out_texture)
+        painter.drawPixmap(scroll_x + WINDOW_WIDTH, 0, fading_out_texture)
+        painter.setOpacity(fade_factor)
+        painter.drawPixmap(scroll_x, 0, fading_in_texture)
+        painter.drawPixmap(scroll_x + WINDOW_WIDTH, 0, fading_in_texture)
+        painter.restore()
+
+        for cloud in self.clouds.values():
+            if not cloud.layer:
+                cloud.draw(painter)
+
+        for pipe in self.pipes.values():
+            pipe.draw(painter, WINDOW_HEIGHT)
+
+        self.ground.draw(painter)
+
+        if state["is_cloudy_sky"]:
+            painter.setBrush(QColor(SCREEN_DARKENING_COLOR_R, SCREEN_DARKENING_COLOR_G, SCREEN_DARKENING_COLOR_B))
+            painter.setOpacity(SCREEN_DARKENING_OPACITY)
+            painter.drawRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+            painter.setOpacity(GROUND_DARKENING_OPACITY)
+            painter.setBrush(QColor(0, 0, 0))
+            painter.drawRect(0, WINDOW_HEIGHT - GROUND_HEIGHT, WINDOW_WIDTH, GROUND_HEIGHT)
+            painter.setOpacity(1.0)
+
+        bird = self.get_bird(BIRD_SKINS[int(state["bird_color"])], int(state["bird_width"]), int(state["bird_height"]))
+        bird.x = state["bird_x"]
+        bird.y = state["bird_y"]
+        bird.rotation = state["bird_rotation"]
+        bird.frame = int(state["bird_frame"]) % len(bird.sprite_frames)
+        bird.draw(painter)
+
+        for cloud in self.clouds.values():
+            if cloud.layer:
+                cloud.draw(painter)
+
+        score_str = str(int(state["score"]))
+        x_start = (WINDOW_WIDTH - sum(self.number_sprites[int(digit)].width() for digit in score_str)) / 2
+        for digit in score_str:
+            sprite = self.number_sprites[int(digit)]
+            painter.drawPixmap(int(x_start), 50, sprite)
+            x_start += sprite.width()
+
+        game_state = GameState(int(state["game_state"]))
+        if game_state == GameState.MAIN_MENU:
+            painter.drawPixmap(int((WINDOW_WIDTH - self.message_image.width()) / 2), 50, self.message_image)
+        elif game_state == GameState.GAME_OVER:
+            painter.drawPixmap(int((WINDOW_WIDTH - self.game_over_image.width()) / 2), 100, self.game_over_image)
+
+        if state["event"]:
+            painter.setPen(QColor(0, 0, 0, 150))
+            painter.drawText(20, WINDOW_HEIGHT - 40, f"Event: {RANDOM_EVENTS[int(state['event']) - 1]}")
+
+
+def record(address, path):
+    # Logging boxes don't need a display; just append every datagram, length-prefixed
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(parse_address(address))
+    with open(path, "ab") as f:
+        while True:
+            data = receiver.recv(MAX_DATAGRAM_SIZE)
+            f.write(struct.pack("<I", len(data)))
+            f.write(data)
+            f.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch or record a game broadcast with FLAPPY_SPECTATOR.")
+    parser.add_argument("--listen", default="127.0.0.1:5005", help="host:port to receive snapshots on")
+    parser.add_argument("--record", metavar="FILE", help="Append raw snapshots to FILE instead of showing them")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.listen, args.record)
+    else:
+        app = QApplication(sys.argv)
+        viewer = SpectatorViewer(args.listen)
+        viewer.show()
+        sys.exit(app.exec_())
@@ -0,0 +1,216 @@
+import argparse
+import array
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import time
+
+import main
+from main import GameWindow, GameState, DEATH_CAUSES
+from telemetry import percentile
+
+# --- Balance Parameter Sweep ---
+# Plays many headless games per parameter set with the scripted Autopilot, spread over a process pool.
+# Results are appended to one binary file per column as tasks finish, so an interrupted sweep resumes
+# by skipping the (point, seed) pairs already on disk.
+SWEEP_PARAMETERS = {
+    "SPECIAL_PIPE_CHANCE": main,
+    "MOVING_PIPE_CHANCE": main,
+    "DOUBLE_MOVING_PIPE_CHANCE": main,
+    "MOVING_PIPE_GAP": main,
+    "MOON_GRAVITY_PIPE_GAP_HEIGHT": GameWindow,
+    "EVENT_DURATION_MIN": GameWindow,
+    "EVENT_DURATION_MAX": GameWindow,
+}
+RESULT_COLUMNS = [("point", "I"), ("seed", "I"), ("score", "I"), ("ticks", "I"), ("cause", "B")]
+MODES = {"adventure": GameState.ADVENTURE_MODE, "pipe_control": GameState.PIPE_CONTROL_MODE}
+SURVIVAL_CHECKPOINTS = [250, 500, 1000, 2000, 4000, 8000, 16000, 32000]
+
+
+def apply_parameters(params):
+    for name, value in params.items():
+        owner = SWEEP_PARAMETERS[name]
+        # Keep ints as ints; random.randint() rejects float bounds
+        setattr(owner, name, type(getattr(owner, name))(value))
+
+
+class ColumnStore:
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.paths = {name: os.path.join(directory, f"{name}.{typecode}") for name, typecode in RESULT_COLUMNS}
+
+    def load(self):
+        columns = {}
+        for name, typecode in RESULT_COLUMNS:
+            values = array.array(typecode)
+            if os.path.exists(self.paths[name]):
+                with open(self.paths[name], "rb") as f:
+                    data = f.read()
+                values.frombytes(data[:len(data) - len(data) % values.itemsize])
+            columns[name] = values
+
+        # An interrupted append can leave columns with different lengths; keep only complete rows
+        rows = min(len(values) for values in columns.values())
+        for name, typecode in RESULT_COLUMNS:
+            if len(columns[name]) != rows:
+                del columns[name][rows:]
+                with open(self.paths[name], "wb") as f:
+                    columns[name].tofile(f)
+        return columns
+
+    def append(self, rows):
+        for index, (name, typecode) in enumerate(RESULT_COLUMNS):
+            with open(self.paths[name], "ab") as f:
+                array.array(typecode, (row[index] for row in rows)).tofile(f)
+
+
+# --- Worker Process ---
+worker_app = None
+worker_window = None
+
+
+def init_worker():
+    global worker_app, worker_window
+    from headless import create_app
+    worker_app = create_app()
+    worker_window = GameWindow()
+
+
+def run_task(task):
+    from headless import Autopilot, HeadlessRunner
+
+    point_id, params, seeds, game_mode, max_ticks, miss_chance = task
+    window = worker_window
+    apply_parameters(params)
+    rows = []
+    for seed in seeds:
+        main.rng.seed(seed)
+        policy = Autopilot(rng=random.Random(seed ^ 0x5EED), miss_chance=miss_chance)
+        runner = HeadlessRunner(window, game_mode, policy, auto_restart=False)
+        runner.start()
+        while window.game_state != GameState.GAME_OVER and runner.tick < max_ticks:
+            runner.step()
+        if window.game_state != GameState.GAME_OVER:
+            window.game_over()
+        cause = DEATH_CAUSES.index(window.death_cause) + 1 if window.death_cause else 0
+        rows.append((point_id, seed, window.score, runner.tick, cause))
+        window.game_over_timer.stop()
+        window.restart_game()
+    return rows
+
+
+# --- Sweep Driver ---
+def parse_assignment(text):
+    name, _, values = text.partition("=")
+    if name not in SWEEP_PARAMETERS:
+        raise argparse.ArgumentTypeError(f"unknown parameter '{name}', expected one of {', '.join(SWEEP_PARAMETERS)}")
+    return name, values
+
+
+def build_points(args):
+    if args.random:
+        rng = random.Random(args.seed)
+        ranges = {}
+        for name, values in args.range:
+            low, _, high = values.partition(":")
+            ranges[name] = (float(low), float(high))
+        return [{name: rng.uniform(low, high) for name, (low, high) in ranges.items()} for _ in range(args.random)]
+
+    names = [name for name, _ in args.grid]
+    value_lists = [[float(value) for value in values.split(",")] for _, values in args.grid]
+    return [dict(zip(names, combination)) for combination in itertools.product(*value_lists)]
+
+
+def report(points, columns, max_ticks):
+    results = []
+    checkpoints = [tick for tick in SURVIVAL_CHECKPOINTS if tick < max_ticks] + [max_ticks]
+    for point_id, params in enumerate(points):
+        rows = [index for index, point in enumerate(columns["point"]) if point == point_id]
+        if not rows:
+            continue
+        scores = [columns["score"][index] for index in rows]
+        ticks = [columns["ticks"][index] for index in rows]
+        causes = [columns["cause"][index] for index in rows]
+        results.append({
+            "point": point_id,
+            "params": params,
+            "games": len(rows),
+            "score_mean": statistics.mean(scores),
+            "score_median": statistics.median(scores),
+            "score_p90": percentile(scores, 90),
+            "ticks_mean": statistics.mean(ticks),
+            # Fraction of games still alive at each tick checkpoint
+            "survival": {tick: sum(1 for t in ticks if t >= tick) / len(ticks) for tick in checkpoints},
+            "deaths": {name: causes.count(index) for index, name in enumerate(["timeout"] + DEATH_CAUSES)},
+        })
+
+    for result in results:
+        params = ", ".join(f"{name}={value:g}" for name, value in result["params"].items())
+        survival = " ".join(f"{tick}:{alive:.2f}" for tick, alive in result["survival"].items())
+        print(f"[{result['point']}] {params}")
+        print(f"    {result['games']} games, score mean {result['score_mean']:.2f} median {result['score_median']:g} "
+              f"p90 {result['score_p90']}, survival {survival}, deaths {result['deaths']}")
+    return results
+
+
+def main_sweep(args):
+    store = ColumnStore(args.output)
+    points_path = os.path.join(args.output, "points.json")
+    if os.path.exists(points_path):
+        with open(points_path) as f:
+            points = json.load(f)
+        print(f"Resuming sweep in '{args.output}' with {len(points)} parameter sets")
+    else:
+        points = build_points(args)
+        with open(points_path, "w") as f:
+            json.dump(points, f, indent=4)
+
+    columns = store.load()
+    done = set(zip(columns["point"], columns["seed"]))
+    tasks = []
+    for point_id, params in enumerate(points):
+        seeds = [args.seed + game for game in range(args.games) if (point_id, args.seed + game) not in done]
+        for start in range(0, len(seeds), args.chunk):
+            tasks.append((point_id, params, seeds[start:start + args.chunk], MODES[args.mode],
+                          args.max_ticks, args.miss_chance))
+
+    total_games = sum(len(task[2]) for task in tasks)
+    print(f"{len(done)} games already recorded, {total_games} to run on {args.workers} workers")
+    start_time = time.perf_counter()
+    finished = 0
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(args.workers, initializer=init_worker) as pool:
+        for rows in pool.imap_unordered(run_task, tasks):
+            store.append(rows)
+            finished += len(rows)
+            elapsed = time.perf_counter() - start_time
+            print(f"\r{finished}/{total_games} games, {finished / elapsed:.1f} games/s", end="", flush=True)
+        # Leaving the with block terminates the workers; let them exit on their own instead
+        pool.close()
+        pool.join()
+    if total_games:
+        print()
+
+    results = report(points, store.load(), args.max_ticks)
+    with open(os.path.join(args.output, "report.json"), "w") as f:
+        json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo sweep of game balance constants.")
+    parser.add_argument("--grid", type=parse_assignment, action="append", default=[], metavar="NAME=V1,V2,...")
+    parser.add_argument("--random", type=int, default=0, metavar="N", help="Sample N points from --range instead")
+    parser.add_argument("--range", type=parse_assignment, action="append", default=[], metavar="NAME=LOW:HIGH")
+    parser.add_argument("--games", type=int, default=100, help="Games per parameter set")
+    parser.add_argument("--chunk", type=int, default=10, help="Games per task sent to a worker")
+    parser.add_argument("--max-ticks", type=int, default=20000)
+    parser.add_argument("--miss-chance", type=float, default=0.02, help="Chance the autopilot skips a flap")
+    parser.add_argument("--mode", choices=MODES, default="adventure")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--output", default="sweep_results")
+    main_sweep(parser.parse_args())
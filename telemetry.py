@@ -0,0 +1,135 @@
+import array
+import bisect
+import json
+import os
+import threading
+import time
+
+# --- Telemetry ---
+# Counters and histograms live in one preallocated array of doubles. Metrics are registered once at
+# startup and addressed by slot index, so recording is a single in-place add on the game thread with no
+# lock. The flush thread is the only other reader; copying the array is one C call under the GIL, so
+# every flush sees a consistent snapshot.
+PROMETHEUS_FILE = "telemetry.prom"
+JSONL_FILE = "telemetry.jsonl"
+
+
+def format_value(value):
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def percentile(samples, p):
+    # Nearest-rank percentile; the game's latency stats, the spectator and the sweep all report with it
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, -(-len(ordered) * p // 100) - 1))]
+
+
+class Telemetry:
+    def __init__(self):
+        self.values = array.array("d")
+        self.metrics = []  # (kind, name, help, slot, label name, label values or bucket bounds)
+        self.bounds = {}
+        self.directory = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def allocate(self, size):
+        slot = len(self.values)
+        self.values.extend([0.0] * size)
+        return slot
+
+    def counter(self, name, help_text, label=None, label_values=None):
+        # One slot per label value; record with count(slot + index)
+        label_values = list(label_values) if label else [None]
+        slot = self.allocate(len(label_values))
+        self.metrics.append(("counter", name, help_text, slot, label, label_values))
+        return slot
+
+    def histogram(self, name, help_text, bounds):
+        # One slot per bucket (the last is +Inf), then the sum, then the count
+        bounds = tuple(bounds)
+        slot = self.allocate(len(bounds) + 3)
+        self.metrics.append(("histogram", name, help_text, slot, None, bounds))
+        self.bounds[slot] = bounds
+        return slot
+
+    def count(self, slot, amount=1):
+        self.values[slot] += amount
+
+    def observe(self, slot, value):
+        bounds = self.bounds[slot]
+        values = self.values
+        values[slot + bisect.bisect_left(bounds, value)] += 1
+        values[slot + len(bounds) + 1] += value
+        values[slot + len(bounds) + 2] += 1
+
+    def start(self, directory, interval):
+        if self.thread is not None:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval,), name="telemetry", daemon=True)
+        self.thread.start()
+
+    def run(self, interval):
+        while not self.stop_event.wait(interval):
+            self.flush()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.flush()
+
+    def flush(self):
+        values = self.values[:]
+        timestamp = time.time()
+        try:
+            prometheus_path = os.path.join(self.directory, PROMETHEUS_FILE)
+            # Scrapers must never see a half-written file
+            with open(prometheus_path + ".tmp", "w") as f:
+                f.write(self.prometheus(values))
+            os.replace(prometheus_path + ".tmp", prometheus_path)
+            with open(os.path.join(self.directory, JSONL_FILE), "a") as f:
+                f.write(json.dumps(self.json_record(values, timestamp)) + "\n")
+        except OSError as e:
+            print(f"Error writing telemetry: {e}")
+
+    def prometheus(self, values):
+        lines = []
+        for kind, name, help_text, slot, label, extra in self.metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "counter":
+                for index, label_value in enumerate(extra):
+                    labels = f'{{{label}="{label_value}"}}' if label else ""
+                    lines.append(f"{name}{labels} {format_value(values[slot + index])}")
+            else:
+                cumulative = 0
+                for index, bound in enumerate(extra + ("+Inf",)):
+                    cumulative += values[slot + index]
+                    lines.append(f'{name}_bucket{{le="{bound}"}} {format_value(cumulative)}')
+                lines.append(f"{name}_sum {format_value(values[slot + len(extra) + 1])}")
+                lines.append(f"{name}_count {format_value(values[slot + len(extra) + 2])}")
+        return "\n".join(lines) + "\n"
+
+    def json_record(self, values, timestamp):
+        record = {"timestamp": timestamp}
+        for kind, name, help_text, slot, label, extra in self.metrics:
+            if kind == "counter" and label:
+                record[name] = {label_value: values[slot + index] for index, label_value in enumerate(extra)}
+            elif kind == "counter":
+                record[name] = values[slot]
+            else:
+                bucket_names = [str(bound) for bound in extra] + ["+Inf"]
+                record[name] = {
+                    "buckets": dict(zip(bucket_names, values[slot:slot + len(extra) + 1])),
+                    "sum": values[slot + len(extra) + 1],
+                    "count": values[slot + len(extra) + 2],
+                }
+        return record
@@ -0,0 +1,338 @@
+import argparse
+import gc
+import json
+import math
+import random
+import sys
+import time
+
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtGui import QColor, QFont, QImage, QKeySequence, QPainter, QPen
+from PyQt5.QtCore import Qt, QRect, QTimer
+
+from main import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, GROUND_HEIGHT, PACING_SAMPLES, GameWindow, GameState, GameClock, GameRandom,
+    FrameBudget, LatencyStats, sound_bank, telemetry,
+)
+from headless import create_app, Autopilot, HeadlessRunner
+from soak import rss_bytes
+
+# --- Tournament Host ---
+# Runs one GameWindow per player in a single process. Assets, the atlas and the sound bank are module-level
+# singletons in main, so every player after the first only adds its own game state. The windows are never
+# shown: one timer steps every game and one widget paints them side by side next to the standings.
+# Each player's window gets its own game clock and random streams, and flaps play on any free mixer channel
+# rather than the one reserved wing channel, so simultaneous flaps don't cut each other off.
+# Garbage collection is process-wide too: the host owns the only enabled FrameBudget and keeps gc paused
+# while any player is mid-run, so one player's game over doesn't collect during everyone else's play.
+MODES = {"adventure": GameState.ADVENTURE_MODE, "pipe_control": GameState.PIPE_CONTROL_MODE}
+TOURNAMENT_KEYS = [Qt.Key_A, Qt.Key_L, Qt.Key_Z, Qt.Key_M, Qt.Key_Q, Qt.Key_O, Qt.Key_1, Qt.Key_0]
+TOURNAMENT_COLUMNS = 4
+STANDINGS_WIDTH = 200
+STANDINGS_ROW_HEIGHT = 38
+RESTART_HOLD_TICKS = 30  # Ticks a game over stays up before the player's key starts the next run
+LABEL_Y = WINDOW_HEIGHT - GROUND_HEIGHT + 32  # Player label sits on the ground, between the menu text and HUD
+DEFAULT_BENCHMARK_PLAYERS = "1,2,4,8,16"
+CHANNELS_PER_PLAYER = 3  # Wing, point and hit/die sounds can overlap within one game
+
+
+class Player:
+    def __init__(self, index, name, key, game_mode, seed, display_scale, policy=None, auto_restart=False):
+        self.index = index
+        self.name = name
+        self.key = key
+        # Same seed for everyone: players who start together get the same pipes
+        self.clock = GameClock()
+        self.rng = GameRandom(seed)
+        self.cloud_rng = random.Random(seed)
+        self.window = GameWindow(display_scale=display_scale, threaded=False, frame_budget=FrameBudget(False),
+                                 clock=self.clock, rng=self.rng, cloud_rng=self.cloud_rng)
+        self.window.debug_mode = False
+        self.runner = HeadlessRunner(self.window, game_mode, policy, auto_restart)
+        self.best = 0
+        self.last_state = self.window.game_state
+
+    def step(self):
+        self.runner.step()
+        state = self.window.game_state
+        if state == GameState.GAME_OVER and self.last_state != GameState.GAME_OVER:
+            self.best = max(self.best, self.window.score)
+        self.last_state = state
+
+    def press(self):
+        window = self.window
+        if window.game_state == GameState.MAIN_MENU:
+            self.runner.start()
+        elif window.game_state == GameState.GAME_OVER:
+            if self.runner.hold_ticks >= RESTART_HOLD_TICKS:
+                window.restart_game()
+                self.runner.hold_ticks = 0
+                self.runner.start()
+        else:
+            window.input_queue.push("flap")
+
+    def is_playing(self):
+        return self.window.game_state in [GameState.ADVENTURE_MODE, GameState.PIPE_CONTROL_MODE]
+
+    def standing_score(self):
+        # The live run counts as soon as it beats the player's best
+        return max(self.best, self.window.score) if self.is_playing() else self.best
+
+    def status(self):
+        if self.is_playing():
+            return f"playing: {self.window.score}"
+        if self.window.game_state == GameState.GAME_OVER:
+            return f"game over: {self.window.score}"
+        return "waiting"
+
+
+class TournamentHost(QWidget):
+    def __init__(self, names, game_mode, display_scale=1.0, columns=TOURNAMENT_COLUMNS, seed=None):
+        super().__init__()
+        self.setWindowTitle("Flappy Bird: EXTENDED - Tournament")
+        self.game_mode = game_mode
+        self.display_scale = display_scale
+        self.columns = columns
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.players = []
+        # Paces the shared driver only; each game advances its own clock once per tick
+        self.clock = GameClock()
+        self.paused = False
+        self.step_times = LatencyStats(PACING_SAMPLES)
+        self.paint_times = LatencyStats(PACING_SAMPLES)
+        self.frame_budget = FrameBudget()
+        self.in_play = False
+        for name in names:
+            self.add_player(name)
+        self.frame_budget.freeze_startup()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.run_frame)
+        self.timer.start(GameWindow.TICK_INTERVAL)
+
+    def add_player(self, name, policy=None, auto_restart=False):
+        index = len(self.players)
+        key = TOURNAMENT_KEYS[index] if index < len(TOURNAMENT_KEYS) else None
+        player = Player(index, name, key, self.game_mode, self.seed, self.display_scale, policy, auto_restart)
+        self.players.append(player)
+        sound_bank.share_wing_channel(len(self.players) * CHANNELS_PER_PLAYER)
+        columns, rows = self.grid()
+        self.setFixedSize(round((columns * WINDOW_WIDTH + STANDINGS_WIDTH) * self.display_scale),
+                          round(rows * WINDOW_HEIGHT * self.display_scale))
+        return player
+
+    def grid(self):
+        columns = max(1, min(self.columns, len(self.players)))
+        return columns, max(1, math.ceil(len(self.players) / columns))
+
+    def player_at(self, x, y):
+        # Returns the player whose panel contains the window position, and the position inside that panel
+        columns, rows = self.grid()
+        x /= self.display_scale
+        y /= self.display_scale
+        column, row = int(x // WINDOW_WIDTH), int(y // WINDOW_HEIGHT)
+        index = row * columns + column
+        if column >= columns or index >= len(self.players):
+            return None, 0, 0
+        return self.players[index], x - column * WINDOW_WIDTH, y - row * WINDOW_HEIGHT
+
+    def step_all(self):
+        for _ in range(self.clock.frame_ticks()):
+            for player in self.players:
+                player.step()
+            self.frame_budget.tick()
+        self.update_frame_budget()
+
+    def update_frame_budget(self):
+        # Collect only once nobody is mid-run, or while the whole tournament is paused
+        in_play = not self.paused and any(player.is_playing() for player in self.players)
+        if in_play and not self.in_play:
+            self.frame_budget.enter_play()
+        elif self.in_play and not in_play:
+            self.frame_budget.safe_point()
+        self.in_play = in_play
+
+    def run_frame(self):
+        start = time.perf_counter()
+        if not self.paused:
+            self.step_all()
+        self.step_times.add(time.perf_counter() - start)
+        self.update()
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        self.render_tournament(painter)
+        painter.end()
+        self.paint_times.add(time.perf_counter() - start)
+
+    def render_tournament(self, painter):
+        painter.scale(self.display_scale, self.display_scale)
+        columns, rows = self.grid()
+        for player in self.players:
+            painter.save()
+            painter.translate((player.index % columns) * WINDOW_WIDTH, (player.index // columns) * WINDOW_HEIGHT)
+            painter.setClipRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+            player.window.render_scene(painter)
+            self.draw_label(painter, player)
+            painter.restore()
+
+        for index in range(len(self.players), columns * rows):
+            painter.fillRect((index % columns) * WINDOW_WIDTH, (index // columns) * WINDOW_HEIGHT, WINDOW_WIDTH,
+                             WINDOW_HEIGHT, QColor(30, 30, 40))
+        painter.setPen(QPen(QColor(30, 30, 40), 2))
+        for column in range(1, columns):
+            painter.drawLine(column * WINDOW_WIDTH, 0, column * WINDOW_WIDTH, rows * WINDOW_HEIGHT)
+        for row in range(1, rows):
+            painter.drawLine(0, row * WINDOW_HEIGHT, columns * WINDOW_WIDTH, row * WINDOW_HEIGHT)
+        self.draw_standings(painter, columns * WINDOW_WIDTH, rows * WINDOW_HEIGHT)
+
+    def draw_label(self, painter, player):
+        key = f" [{QKeySequence(player.key).toString()}]" if player.key is not None else ""
+        painter.setOpacity(0.6)
+        painter.fillRect(0, LABEL_Y, WINDOW_WIDTH, 20, QColor(0, 0, 0))
+        painter.setOpacity(1.0)
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(QFont("Arial", 11, QFont.Bold))
+        painter.drawText(QRect(0, LABEL_Y, WINDOW_WIDTH, 20), Qt.AlignCenter, f"{player.name}{key}")
+
+    def standings(self):
+        return sorted(self.players, key=lambda player: (-player.standing_score(), player.index))
+
+    def draw_standings(self, painter, x, height):
+        painter.fillRect(x, 0, STANDINGS_WIDTH, height, QColor(30, 30, 40))
+        painter.setPen(QColor(255, 215, 0))
+        painter.setFont(QFont("Arial", 14, QFont.Bold))
+        painter.drawText(QRect(x, 10, STANDINGS_WIDTH, 24), Qt.AlignCenter, "--- STANDINGS ---")
+
+        y = 44
+        for rank, player in enumerate(self.standings(), 1):
+            if y + STANDINGS_ROW_HEIGHT > height - 40:
+                break
+            painter.setPen(QColor(255, 255, 255))
+            painter.setFont(QFont("Arial", 12, QFont.Bold))
+            painter.drawText(QRect(x + 10, y, STANDINGS_WIDTH - 20, 18), Qt.AlignLeft | Qt.AlignVCenter,
+                             f"{rank}. {player.name}")
+            painter.drawText(QRect(x + 10, y, STANDINGS_WIDTH - 20, 18), Qt.AlignRight | Qt.AlignVCenter,
+                             str(player.standing_score()))
+            painter.setPen(QColor(180, 180, 180))
+            painter.setFont(QFont("Arial", 9))
+            painter.drawText(QRect(x + 24, y + 18, STANDINGS_WIDTH - 34, 14), Qt.AlignLeft | Qt.AlignVCenter,
+                             f"{player.status()}, {player.runner.runs} runs")
+            y += STANDINGS_ROW_HEIGHT
+
+        painter.setPen(QColor(180, 180, 180))
+        painter.setFont(QFont("Arial", 9))
+        footer = "PAUSED - Space: resume" if self.paused else "Space: pause, Esc: quit"
+        painter.drawText(QRect(x, height - 40, STANDINGS_WIDTH, 16), Qt.AlignCenter, footer)
+        painter.drawText(QRect(x, height - 24, STANDINGS_WIDTH, 16), Qt.AlignCenter, "Flap: your key or click")
+
+    def keyPressEvent(self, event):
+        if event.isAutoRepeat():
+            return
+        key = event.key()
+        if key == Qt.Key_Escape:
+            self.close()
+        elif key == Qt.Key_Space:
+            self.paused = not self.paused
+            self.update_frame_budget()
+            self.update()
+        elif not self.paused:
+            for player in self.players:
+                if player.key == key:
+                    player.press()
+
+    def mousePressEvent(self, event):
+        player, _, _ = self.player_at(event.x(), event.y())
+        if player and not self.paused:
+            player.press()
+
+    def mouseMoveEvent(self, event):
+        player, _, y = self.player_at(event.x(), event.y())
+        if player and player.window.game_state == GameState.PIPE_CONTROL_MODE:
+            player.window.input_queue.push_mouse_move(int(y))
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        for player in self.players:
+            player.window.stop_ghost()
+        telemetry.stop()
+        print("Final standings:")
+        for rank, player in enumerate(self.standings(), 1):
+            print(f"    {rank}. {player.name}: {player.standing_score()} ({player.runner.runs} runs)")
+        print(f"Step time: {self.step_times.report()}")
+        print(f"Paint time: {self.paint_times.report()}")
+        super().closeEvent(event)
+
+    def results(self):
+        return [{"name": player.name, "best": player.standing_score(), "runs": player.runner.runs}
+                for player in self.standings()]
+
+
+def benchmark(args):
+    # Adds autopiloted players one at a time and measures what each batch of players costs on top of the last
+    app = create_app()
+    host = TournamentHost([], MODES[args.mode], args.scale, args.columns, args.seed)
+    host.timer.stop()
+    counts = sorted({int(count) for count in args.benchmark.split(",")})
+    baseline_rss = rss_bytes()
+    previous_count, previous_cpu, previous_rss = 0, 0.0, baseline_rss
+    print(f"{args.frames} frames per row, step + composited paint; RSS before the first player "
+          f"{baseline_rss / 2 ** 20:.1f} MiB")
+    for count in counts:
+        while len(host.players) < count:
+            host.add_player(f"P{len(host.players) + 1}", policy=Autopilot(), auto_restart=True)
+        image = QImage(host.width(), host.height(), QImage.Format_RGB32)
+        step_time = paint_time = 0.0
+        for frame in range(args.warmup + args.frames):
+            if frame == args.warmup:
+                gc.collect()
+                step_time = paint_time = 0.0
+                cpu_start = time.process_time()
+            start = time.perf_counter()
+            host.step_all()
+            step_end = time.perf_counter()
+            painter = QPainter(image)
+            host.render_tournament(painter)
+            painter.end()
+            step_time += step_end - start
+            paint_time += time.perf_counter() - step_end
+        cpu = (time.process_time() - cpu_start) / args.frames
+        rss = rss_bytes()
+        added = count - previous_count
+        print(f"{count:3d} players  CPU {cpu * 1000:7.2f} ms/frame "
+              f"(step {step_time / args.frames * 1000:6.2f}, paint {paint_time / args.frames * 1000:6.2f})  "
+              f"+{(cpu - previous_cpu) / added * 1000:5.2f} ms per added player  "
+              f"RSS {rss / 2 ** 20:7.1f} MiB  +{(rss - previous_rss) / added / 1024:7.0f} KiB per added player")
+        previous_count, previous_cpu, previous_rss = count, cpu, rss
+    app.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run several games side by side in one window, one per player.")
+    parser.add_argument("players", nargs="*", default=["Player 1", "Player 2"], help="Player names")
+    parser.add_argument("--mode", choices=MODES, default="adventure")
+    parser.add_argument("--scale", type=float, default=1.0, help="Display scale of every panel")
+    parser.add_argument("--columns", type=int, default=TOURNAMENT_COLUMNS, help="Panels per row")
+    parser.add_argument("--seed", type=int, help="Pipe sequence shared by all players (random by default)")
+    parser.add_argument("--results", metavar="FILE", help="Write the final standings as JSON on exit")
+    parser.add_argument("--benchmark", nargs="?", const=DEFAULT_BENCHMARK_PLAYERS, metavar="COUNTS",
+                        help="Measure CPU and memory per added player at these player counts instead of playing")
+    parser.add_argument("--frames", type=int, default=600, help="Measured frames per benchmark row")
+    parser.add_argument("--warmup", type=int, default=120, help="Frames before each benchmark row")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args)
+        sys.exit(0)
+
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    app = QApplication(sys.argv)
+    host = TournamentHost(args.players, MODES[args.mode], args.scale, args.columns, args.seed)
+    host.show()
+    status = app.exec_()
+    if args.results:
+        with open(args.results, "w") as f:
+            json.dump(host.results(), f, indent=4)
+    sys.exit(status)